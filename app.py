@@ -12,26 +12,45 @@ from widgets.quest_editor import QuestEditor
 
 
 APP_TITLE = "EmuCoach Quest Editor (PyQt6)"
+_CONFIG_PATH = Path(__file__).resolve().parent / "config.json"
+
+
+_ROLE = QtGui.QPalette.ColorRole
+
+# (role, rgb) for the dark theme; turned into a QPalette once per process
+_DARK_COLORS = (
+    (_ROLE.Window, (37, 37, 38)),
+    (_ROLE.WindowText, (220, 220, 220)),
+    (_ROLE.Base, (30, 30, 30)),
+    (_ROLE.AlternateBase, (45, 45, 45)),
+    (_ROLE.ToolTipBase, (255, 255, 220)),
+    (_ROLE.ToolTipText, (0, 0, 0)),
+    (_ROLE.Text, (220, 220, 220)),
+    (_ROLE.Button, (45, 45, 45)),
+    (_ROLE.ButtonText, (220, 220, 220)),
+    (_ROLE.BrightText, (255, 0, 0)),
+    (_ROLE.Link, (42, 130, 218)),
+    (_ROLE.Highlight, (42, 130, 218)),
+    (_ROLE.HighlightedText, (0, 0, 0)),
+)
+_DARK_PALETTE: Optional[QtGui.QPalette] = None
+
+
+def _dark_palette() -> QtGui.QPalette:
+    # Built lazily: QPalette needs a QGuiApplication to exist first.
+    global _DARK_PALETTE
+    if _DARK_PALETTE is None:
+        pal = QtGui.QPalette()
+        for role, rgb in _DARK_COLORS:
+            pal.setColor(role, QtGui.QColor(*rgb))
+        _DARK_PALETTE = pal
+    return _DARK_PALETTE
 
 
 def apply_dark_theme(app: QtWidgets.QApplication) -> None:
     # A clean, professional dark theme (Fusion + palette).
     app.setStyle("Fusion")
-    pal = QtGui.QPalette()
-    pal.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor(37, 37, 38))
-    pal.setColor(QtGui.QPalette.ColorRole.WindowText, QtGui.QColor(220, 220, 220))
-    pal.setColor(QtGui.QPalette.ColorRole.Base, QtGui.QColor(30, 30, 30))
-    pal.setColor(QtGui.QPalette.ColorRole.AlternateBase, QtGui.QColor(45, 45, 45))
-    pal.setColor(QtGui.QPalette.ColorRole.ToolTipBase, QtGui.QColor(255, 255, 220))
-    pal.setColor(QtGui.QPalette.ColorRole.ToolTipText, QtGui.QColor(0, 0, 0))
-    pal.setColor(QtGui.QPalette.ColorRole.Text, QtGui.QColor(220, 220, 220))
-    pal.setColor(QtGui.QPalette.ColorRole.Button, QtGui.QColor(45, 45, 45))
-    pal.setColor(QtGui.QPalette.ColorRole.ButtonText, QtGui.QColor(220, 220, 220))
-    pal.setColor(QtGui.QPalette.ColorRole.BrightText, QtGui.QColor(255, 0, 0))
-    pal.setColor(QtGui.QPalette.ColorRole.Link, QtGui.QColor(42, 130, 218))
-    pal.setColor(QtGui.QPalette.ColorRole.Highlight, QtGui.QColor(42, 130, 218))
-    pal.setColor(QtGui.QPalette.ColorRole.HighlightedText, QtGui.QColor(0, 0, 0))
-    app.setPalette(pal)
+    app.setPalette(_dark_palette())
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -44,7 +63,6 @@ class MainWindow(QtWidgets.QMainWindow):
         self.log_view.setReadOnly(True)
 
         self.db = Database(self._load_config())
-        self._connect_db_or_die()
 
         self.search = QuestSearchPanel(self.db, self.log)
         self.editor = QuestEditor(self.db, self.log)
@@ -64,6 +82,7 @@ class MainWindow(QtWidgets.QMainWindow):
         split.setSizes([420, 980])
 
         self.setCentralWidget(split)
+        self._main_split = split
 
         # Bottom diagnostics dock
         dock = QtWidgets.QDockWidget("Diagnostics / Log", self)
@@ -78,7 +97,8 @@ class MainWindow(QtWidgets.QMainWindow):
         # Menu
         self._build_menu()
 
-        self.log("Ready.")
+        # Connect in the background; the window shows right away, disabled until the DB is up
+        self._connect_db_or_die()
 
     def _build_menu(self) -> None:
         m = self.menuBar()
@@ -97,7 +117,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.log_view.appendPlainText(msg)
 
     def _config_path(self) -> Path:
-        return Path(__file__).resolve().parent / "config.json"
+        return _CONFIG_PATH
 
     def _load_config(self) -> DBConfig:
         p = self._config_path()
@@ -113,23 +133,83 @@ class MainWindow(QtWidgets.QMainWindow):
             }, indent=2), encoding="utf-8")
 
         data = json.loads(p.read_text(encoding="utf-8"))
+        data.pop("dbc_dir", None)  # read by config.py, not a DB setting
         return DBConfig(**data)
 
     def open_config(self) -> None:
         QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(str(self._config_path())))
 
     def _connect_db_or_die(self) -> None:
-        try:
-            self.db.connect()
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(
+        self._main_split.setEnabled(False)
+        self.statusBar().showMessage("Connecting…")
+        self.log(f"Connecting to {self.db.cfg.host}:{self.db.cfg.port}/{self.db.cfg.database}…")
+        self.db.connect_async(self._on_db_connected, self._on_db_connect_failed)
+
+    def _on_db_connected(self, _res=None) -> None:
+        self._main_split.setEnabled(True)
+        self.statusBar().clearMessage()
+        self.log("Ready.")
+
+    def _on_db_connect_failed(self, e: Exception) -> None:
+        self.statusBar().showMessage("Not connected")
+        QtWidgets.QMessageBox.critical(
+            self,
+            "DB Connection Failed",
+            f"Could not connect to DB. Edit config.json and restart.\n\n{e}"
+        )
+        self.close()
+
+    def closeEvent(self, e: QtGui.QCloseEvent) -> None:
+        # Loot tab saves are only staged (TxnBuffer); don't drop them silently on exit
+        loot = self.editor.quest_loot
+        txn = loot.loot_txn if loot is not None else None
+        if txn is not None and txn.pending:
+            btn = QtWidgets.QMessageBox.StandardButton
+            ans = QtWidgets.QMessageBox.question(
                 self,
-                "DB Connection Failed",
-                f"Could not connect to DB. Edit config.json and restart.\n\n{e}"
+                "Unsaved loot changes",
+                f"{txn.pending} loot row(s) are staged but not saved yet.\n\nSave them before quitting?",
+                btn.Save | btn.Discard | btn.Cancel,
+                btn.Save,
             )
-            raise
+            if ans == btn.Cancel:
+                e.ignore()
+                return
+            if ans == btn.Save:
+                e.ignore()
+                self._close_after_flush(txn)
+                return
+        elif txn is not None and txn.flushing:
+            e.ignore()  # let the in-flight commit finish first
+            self._close_after_flush(txn)
+            return
+        super().closeEvent(e)
+
+    def _close_after_flush(self, txn) -> None:
+        """Flush the staged loot rows and close once they are committed; stay open if that fails."""
+        def on_flushed(_n: int) -> None:
+            if txn.pending:
+                txn.flush()  # rows staged while the previous batch was in flight
+                return
+            disconnect()
+            # deferred: without a pool the flush (and this signal) runs inside closeEvent
+            QtCore.QTimer.singleShot(0, self.close)
+
+        def on_failed(_e: Exception) -> None:
+            disconnect()  # QuestLootEditor already reported the error; keep the window open
+
+        def disconnect() -> None:
+            txn.flushed.disconnect(on_flushed)
+            txn.flushFailed.disconnect(on_failed)
+
+        txn.flushed.connect(on_flushed)
+        txn.flushFailed.connect(on_failed)
+        self.statusBar().showMessage("Saving pending loot rows…")
+        txn.flush()
 
     def open_quest(self, quest_id: int) -> None:
+        if not self.db.connected:
+            return
         self.editor.load(quest_id)
         
 def main() -> None:
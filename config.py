@@ -1,15 +1,65 @@
-from pathlib import Path
-
-# Change this 
-DBC_DIR = Path(r"C:\Path_To_Your\dbc")
-
-# Optional: per-file overrides
-SKILLLINE_DBC = DBC_DIR / "SkillLine.dbc"
-SPELL_DBC     = DBC_DIR / "Spell.dbc"
-AREATABLE_DBC = DBC_DIR / "AreaTable.dbc"
-
-QUESTSORT_DBC = DBC_DIR / "QuestSort.dbc"
-
-# Extra DBCs used by pickers
-FACTION_DBC       = DBC_DIR / "Faction.dbc"
-CURRENCYTYPES_DBC = DBC_DIR / "CurrencyTypes.dbc"
+import json
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+# DBC folder, resolved once at import:
+#   1. EMUCOACH_DBC_DIR environment variable
+#   2. "dbc_dir" in config.json (next to this file)
+#   3. the default below (change this)
+_DEFAULT_DBC_DIR = r"C:\Path_To_Your\dbc"
+
+
+def _resolve_dbc_dir() -> Path:
+    env = os.environ.get("EMUCOACH_DBC_DIR")
+    if env:
+        return Path(env)
+    try:
+        data = json.loads((Path(__file__).resolve().parent / "config.json").read_text(encoding="utf-8"))
+        if data.get("dbc_dir"):
+            return Path(data["dbc_dir"])
+    except Exception:
+        pass
+    return Path(_DEFAULT_DBC_DIR)
+
+
+DBC_DIR = _resolve_dbc_dir()
+
+# Optional: per-file overrides
+SKILLLINE_DBC = DBC_DIR / "SkillLine.dbc"
+SPELL_DBC     = DBC_DIR / "Spell.dbc"
+AREATABLE_DBC = DBC_DIR / "AreaTable.dbc"
+
+QUESTSORT_DBC = DBC_DIR / "QuestSort.dbc"
+
+# Extra DBCs used by pickers
+FACTION_DBC       = DBC_DIR / "Faction.dbc"
+CURRENCYTYPES_DBC = DBC_DIR / "CurrencyTypes.dbc"
+
+
+@contextmanager
+def dbc(name) -> Iterator[mmap.mmap]:
+    """
+    Read-only memory map of a DBC file (name relative to DBC_DIR, or a full path):
+
+        with config.dbc("AreaTable.dbc") as data:
+            ...
+
+    Pages are loaded by the OS on demand. The map is closed when the block
+    exits, so copy out what you need (bytes slices and unpacked ints are
+    copies) and don't keep memoryviews or numpy views of it. Mapping per
+    use means an edited file is always seen at its current length, and the
+    file isn't held open (on Windows: locked against replacement) afterwards.
+    Supports slicing, .find() and struct.unpack_from() like bytes.
+    """
+    p = Path(name)
+    if not p.is_absolute():
+        p = DBC_DIR / p
+    with open(p, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield mm
+    finally:
+        mm.close()
@@ -1,8 +1,32 @@
 from __future__ import annotations
+import copy
+import functools
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-import pymysql
+# Prefer mysqlclient (C escaping/protocol); PyMySQL is the pure-Python fallback.
+# Both use the %s paramstyle and the same cursor classes / CLIENT flags.
+try:
+    import MySQLdb as _driver
+    import MySQLdb.cursors as _cursors
+    from MySQLdb.constants import CLIENT
+except Exception:
+    import pymysql as _driver
+    import pymysql.cursors as _cursors
+    from pymysql.constants import CLIENT
+from PyQt6 import QtCore
+
+from lookup_mirror import MIRRORED_TABLES, LookupMirror
+
+try:
+    from dbutils.pooled_db import PooledDB
+except Exception:
+    PooledDB = None  # single shared connection fallback
 
 
 @dataclass
@@ -28,19 +52,160 @@ _LOOT_TABLE_BY_SOURCE = {
     11: "skinning_loot_template",
     12: "spell_loot_template",
 }
+# Every table name that may be interpolated into loot SQL (identifier allowlist)
+LOOT_TABLES = frozenset(_LOOT_TABLE_BY_SOURCE.values())
+
+# Quest-linked condition types where ConditionValue1 = quest_id.
+# NOTE: Do NOT include "2" (ITEM) here. It's not a quest id link.
+_QUEST_CTYPES_PREVIEW = (8, 9, 14, 28, 43)
+_QUEST_CTYPES_DELETE = (8, 9, 14, 28, 43, 47)
+
+
+@functools.lru_cache(maxsize=64)
+def _ph(n: int) -> str:
+    return ",".join(["%s"] * n)
+
+@functools.lru_cache(maxsize=64)
+def _pair2_ph(n: int) -> str:
+    return ",".join(["(%s,%s)"] * n)
+
+@functools.lru_cache(maxsize=64)
+def _pair4_ph(n: int) -> str:
+    return ",".join(["(%s,%s,%s,%s)"] * n)
+
+_PH_CT_PREVIEW = _ph(len(_QUEST_CTYPES_PREVIEW))
+_PH_CT_DELETE = _ph(len(_QUEST_CTYPES_DELETE))
+
+# Fixed SQL text, built once so every call sends the identical statement
+_SQL_QUEST_KEYS_PREVIEW = (
+    "SELECT DISTINCT SourceTypeOrReferenceId, SourceGroup, SourceEntry, SourceId "
+    "FROM conditions WHERE ConditionTypeOrReference IN (" + _PH_CT_PREVIEW + ") "
+    "AND ConditionValue1 = %s"
+)
+_SQL_QUEST_KEYS_DELETE = (
+    "SELECT DISTINCT SourceTypeOrReferenceId, SourceGroup, SourceEntry, SourceId "
+    "FROM conditions WHERE ConditionTypeOrReference IN (" + _PH_CT_DELETE + ") "
+    "AND ConditionValue1 = %s"
+)
+# Distinct quest-linked keys plus the number of condition rows in each group, in one query.
+# (GROUP BY over a JOIN rather than COUNT(*) OVER () so MySQL 5.x / MariaDB still work.)
+_SQL_QUEST_KEYS_PREVIEW_COUNTED = (
+    "SELECT c.SourceTypeOrReferenceId, c.SourceGroup, c.SourceEntry, c.SourceId, COUNT(*) AS n "
+    "FROM conditions c JOIN (" + _SQL_QUEST_KEYS_PREVIEW + ") k "
+    "ON c.SourceTypeOrReferenceId = k.SourceTypeOrReferenceId AND c.SourceGroup = k.SourceGroup "
+    "AND c.SourceEntry = k.SourceEntry AND c.SourceId = k.SourceId "
+    "GROUP BY c.SourceTypeOrReferenceId, c.SourceGroup, c.SourceEntry, c.SourceId"
+)
+# Condition-group filter; append _pair4_ph(n) + ")"
+_SQL_DELETE_CONDITIONS_BY_KEYS = (
+    "DELETE FROM conditions "
+    "WHERE (SourceTypeOrReferenceId, SourceGroup, SourceEntry, SourceId) IN ("
+)
+_SQL_NEXT_QUEST_ID = "SELECT COALESCE(MAX(entry), 0) AS m FROM quest_template"
+_SQL_CREATE_QUEST = """
+            INSERT INTO quest_template
+            (entry, Method, QuestLevel, MinLevel, MaxLevel)
+            VALUES (%s, %s, %s, %s, %s)
+            """
+# Allocate the next free entry in [min, max] and insert it in one round trip.
+# Result of the last statement: entry, inserted (0 when the range is exhausted).
+_SQL_CREATE_NEXT_QUEST = (
+    "SET @qe_new = (SELECT COALESCE(MAX(entry), %s - 1) + 1 FROM quest_template "
+    "WHERE entry BETWEEN %s AND %s);"
+    "INSERT INTO quest_template (entry, Method, QuestLevel, MinLevel, MaxLevel) "
+    "SELECT @qe_new, 2, 1, 1, 1 FROM DUAL WHERE @qe_new <= %s;"
+    "SELECT @qe_new AS entry, ROW_COUNT() AS inserted"
+)
+
+# Relation rows + the quest itself, sent as one multi-statement batch (one round trip).
+# IMPORTANT: your schema uses quest_template.entry (not Id)
+_SQL_DELETE_QUEST = (
+    "DELETE FROM creature_quest_starter WHERE quest=%s;"
+    "DELETE FROM creature_quest_ender WHERE quest=%s;"
+    "DELETE FROM gameobject_questrelation WHERE quest=%s;"
+    "DELETE FROM gameobject_involvedrelation WHERE quest=%s;"
+    "DELETE FROM quest_template WHERE entry=%s"
+)
+
+# Above this many keys, stage them in a session temp table and JOIN instead of a huge IN (...)
+_TEMP_JOIN_THRESHOLD = 100
+_SQL_TMP_KEYS_CREATE = (
+    "CREATE TEMPORARY TABLE IF NOT EXISTS _quest_del_keys ("
+    "st INT NOT NULL, sg INT NOT NULL, se INT NOT NULL, sid INT NOT NULL, "
+    "PRIMARY KEY (st, sg, se, sid)) ENGINE=MEMORY"
+)
+_SQL_TMP_KEYS_CLEAR = "DELETE FROM _quest_del_keys"
+_SQL_TMP_KEYS_FILL = "INSERT IGNORE INTO _quest_del_keys (st, sg, se, sid) VALUES (%s,%s,%s,%s)"
+_SQL_TMP_KEYS_DELETE_CONDITIONS = (
+    "DELETE c FROM conditions c JOIN _quest_del_keys k "
+    "ON c.SourceTypeOrReferenceId=k.st AND c.SourceGroup=k.sg "
+    "AND c.SourceEntry=k.se AND c.SourceId=k.sid"
+)
+_SQL_TMP_PAIRS_CREATE = (
+    "CREATE TEMPORARY TABLE IF NOT EXISTS _quest_del_pairs ("
+    "entry INT NOT NULL, item INT NOT NULL, PRIMARY KEY (entry, item)) ENGINE=MEMORY"
+)
+_SQL_TMP_PAIRS_CLEAR = "DELETE FROM _quest_del_pairs"
+_SQL_TMP_PAIRS_FILL = "INSERT IGNORE INTO _quest_del_pairs (entry, item) VALUES (%s,%s)"
+_SQL_TMP_PAIRS_DELETE = "DELETE t FROM {table} t JOIN _quest_del_pairs p ON t.entry=p.entry AND t.item=p.item"
+
+# Tables a statement reads from / writes to (used by the query cache)
+_TABLE_RE = re.compile(r"\b(?:INTO|UPDATE|FROM|JOIN)\s+`?(\w+)`?", re.I)
+_WRITE_VERBS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+def _sql_tables(sql: str) -> frozenset:
+    return frozenset(t.lower() for t in _TABLE_RE.findall(sql))
+
+class _DBJobSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(object)
+
+
+class _DBJob(QtCore.QRunnable):
+    """
+    Runs one Database call on a QThreadPool worker.
+    Results come back through signals, so slots run on the GUI thread.
+    """
+    def __init__(self, fn: Callable[..., Any], args: tuple, kwargs: dict):
+        super().__init__()
+        self.signals = _DBJobSignals()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self) -> None:
+        try:
+            res = self._fn(*self._args, **self._kwargs)
+        except Exception as e:
+            self.signals.failed.emit(e)
+            return
+        self.signals.done.emit(res)
+
 
 class Database:
     def __init__(self, cfg: DBConfig):
         self.cfg = cfg
-        self._conn: Optional[pymysql.connections.Connection] = None
+        self._conn: Optional[Any] = None
+        self._pool = None
+        # Per-thread connection pinned by an open transaction (execute -> commit/rollback)
+        self._tls = threading.local()
+
+        # Read-through cache for lookup queries: (sql, params) -> (tables, expires_at, rows)
+        self._qcache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._qcache_max = 256
+        self._qcache_lock = threading.Lock()
+
+        # Local SQLite copy of lookup tables (quest headers for search)
+        self.mirror = LookupMirror(self.iter_rows)
+
+        # Signals of in-flight submit() jobs
+        self._jobs: set = set()
         
         # expose module mapping as an instance attribute (used by preview/delete)
         self._LOOT_TABLE_BY_SOURCE = _LOOT_TABLE_BY_SOURCE
 
-    def connect(self) -> None:
-        if self._conn:
-            return
-        self._conn = pymysql.connect(
+    def _connect_kwargs(self) -> Dict[str, Any]:
+        return dict(
             host=self.cfg.host,
             port=self.cfg.port,
             user=self.cfg.user,
@@ -48,10 +213,57 @@ class Database:
             database=self.cfg.database,
             charset=self.cfg.charset,
             autocommit=False,
-            cursorclass=pymysql.cursors.DictCursor,
+            cursorclass=_cursors.DictCursor,
+            # lets related DELETEs go out in one round trip (see _multi_exec)
+            client_flag=CLIENT.MULTI_STATEMENTS,
         )
 
+    def connect(self) -> None:
+        if self._pool or self._conn:
+            return
+        if PooledDB is not None:
+            # maxcached > mincached keeps recently used connections warm.
+            # ping=0: no COM_PING round trip each time a connection is borrowed
+            # (DBUtils' default); SteadyDB already reopens a dead connection and
+            # retries when a statement fails outside a transaction.
+            self._pool = PooledDB(
+                creator=_driver,
+                mincached=2,
+                maxcached=5,
+                maxconnections=10,
+                blocking=True,
+                ping=0,
+                **self._connect_kwargs(),
+            )
+            return
+        self._conn = _driver.connect(**self._connect_kwargs())
+
+    def connect_async(
+        self,
+        on_done: Callable[[Any], None],
+        on_error: Callable[[Exception], None],
+    ) -> None:
+        """connect() on a QThreadPool worker; callbacks fire on the GUI thread."""
+        job = _DBJob(self.connect, (), {})
+        job.signals.done.connect(on_done)
+        job.signals.failed.connect(on_error)
+        self._jobs.add(job.signals)
+        job.signals.done.connect(lambda _r, sig=job.signals: self._jobs.discard(sig))
+        job.signals.failed.connect(lambda _e, sig=job.signals: self._jobs.discard(sig))
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    @property
+    def connected(self) -> bool:
+        return bool(self._pool or self._conn)
+
     def close(self) -> None:
+        self._drop_cursor()
+        self._tls = threading.local()
+        if self._pool:
+            try:
+                self._pool.close()
+            finally:
+                self._pool = None
         if self._conn:
             try:
                 self._conn.close()
@@ -59,100 +271,261 @@ class Database:
                 self._conn = None
 
     @property
-    def conn(self) -> pymysql.connections.Connection:
+    def conn(self) -> Any:
+        """
+        Connection for the calling thread's open transaction.
+        Pinned until commit()/rollback() when pooling is active.
+        """
+        c = getattr(self._tls, "conn", None)
+        if c is not None:
+            return c
+        if self._pool:
+            c = self._pool.connection()
+            self._tls.conn = c
+            return c
         if not self._conn:
             raise RuntimeError("Database not connected")
         return self._conn
 
+    @contextmanager
+    def _lease(self) -> Iterator[Any]:
+        """
+        Read-only lease: reuse the thread's transaction connection if one is open,
+        otherwise borrow a pooled connection and hand it back afterwards.
+        """
+        c = getattr(self._tls, "conn", None)
+        if c is not None or not self._pool:
+            yield self.conn
+            return
+        c = self._pool.connection()
+        try:
+            yield c
+        finally:
+            c.close()  # returns to pool
+
+    def _release(self) -> None:
+        written = getattr(self._tls, "written", None)
+        if written:
+            self.invalidate_cache(written)
+            self.mirror.invalidate(written)
+            self._tls.written = None
+        self._drop_cursor()
+        c = getattr(self._tls, "conn", None)
+        self._tls.conn = None
+        if c is not None and self._pool:
+            c.close()
+
+    def _cursor(self) -> Any:
+        """
+        Reusable cursor bound to self.conn (the thread's transaction connection,
+        or the single fallback connection). Rebuilt only when that connection changes.
+        """
+        c = self.conn
+        cur = getattr(self._tls, "cur", None)
+        if cur is None or getattr(self._tls, "cur_conn", None) is not c:
+            self._drop_cursor()
+            cur = self._tls.cur = c.cursor()
+            self._tls.cur_conn = c
+        return cur
+
+    def _drop_cursor(self) -> None:
+        cur = getattr(self._tls, "cur", None)
+        self._tls.cur = None
+        self._tls.cur_conn = None
+        if cur is not None:
+            try:
+                cur.close()
+            except Exception:
+                pass
+
     def fetch_all(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
-        with self.conn.cursor() as cur:
+        if self._pool and getattr(self._tls, "conn", None) is None:
+            # short read on a borrowed connection
+            with self._lease() as c, c.cursor() as cur:
+                cur.execute(sql, params)
+                return list(cur.fetchall())
+        cur = self._cursor()
+        cur.execute(sql, params)
+        return list(cur.fetchall())
+
+    def fetch_tuples(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """fetch_all() with a plain tuple cursor, for hot paths that read columns by position."""
+        if self._pool and getattr(self._tls, "conn", None) is None:
+            with self._lease() as c, c.cursor(_cursors.Cursor) as cur:
+                cur.execute(sql, params)
+                return list(cur.fetchall())
+        with self.conn.cursor(_cursors.Cursor) as cur:
             cur.execute(sql, params)
             return list(cur.fetchall())
 
+    def iter_rows(self, sql: str, params: Sequence[Any] = ()) -> Iterator[Dict[str, Any]]:
+        """
+        Stream rows one at a time through a server-side (SSDictCursor) cursor.
+        The leased connection stays busy until the generator is exhausted or closed,
+        so close() it when abandoning a scan. Without a pool the single connection
+        can't be tied up, so rows are buffered via fetch_all instead.
+        """
+        if not self._pool or getattr(self._tls, "conn", None) is not None:
+            yield from self.fetch_all(sql, params)
+            return
+        c = self._pool.connection()
+        try:
+            cur = c.cursor(_cursors.SSDictCursor)
+            try:
+                cur.execute(sql, params)
+                for row in cur:
+                    yield row
+            finally:
+                cur.close()
+        finally:
+            c.close()
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Run fn(*args, **kwargs) off the GUI thread and deliver the result to on_done
+        (or the exception to on_error) back on the GUI thread.
+        Callbacks are connected before the job starts, so no result is lost.
+
+        Without a pool there is only one connection, which must not be shared across
+        threads, so the call runs inline instead.
+        """
+        if not self._pool:
+            try:
+                res = fn(*args, **kwargs)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(e)
+                return
+            if on_done is not None:
+                on_done(res)
+            return
+
+        job = _DBJob(fn, args, kwargs)
+        if on_done is not None:
+            job.signals.done.connect(on_done)
+        if on_error is not None:
+            job.signals.failed.connect(on_error)
+        # keep the signals object alive until the job reports back
+        self._jobs.add(job.signals)
+        job.signals.done.connect(lambda _r, sig=job.signals: self._jobs.discard(sig))
+        job.signals.failed.connect(lambda _e, sig=job.signals: self._jobs.discard(sig))
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def refresh_mirror(self, table: str, on_error: Optional[Callable[[Exception], None]] = None) -> None:
+        """
+        Rebuild a mirrored table on a worker. Skipped without a pool, where submit()
+        would run the full table pull inline on the GUI thread.
+        """
+        if self._pool:
+            self.submit(self.mirror.refresh, table, on_error=on_error)
+
+    def fetch_all_cached(
+        self, sql: str, params: Sequence[Any] = (), ttl: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        fetch_all() with an in-process LRU cache.
+        Entries are dropped whenever execute()/executemany() writes to a table the query reads.
+        Callers get a copy, so mutating the result never touches the cache.
+        """
+        key = (sql, tuple(params))
+        now = time.monotonic()
+        with self._qcache_lock:
+            hit = self._qcache.get(key)
+            if hit is not None:
+                _tables, expires, rows = hit
+                if expires is None or expires > now:
+                    self._qcache.move_to_end(key)
+                    return copy.deepcopy(rows)
+                del self._qcache[key]
+
+        rows = self.fetch_all(sql, params)
+        expires = (now + ttl) if ttl else None
+        with self._qcache_lock:
+            self._qcache[key] = (_sql_tables(sql), expires, rows)
+            self._qcache.move_to_end(key)
+            while len(self._qcache) > self._qcache_max:
+                self._qcache.popitem(last=False)
+        return copy.deepcopy(rows)
+
+    def invalidate_cache(self, tables: Optional[Iterable[str]] = None) -> None:
+        """Drop cached reads touching any of tables (all entries if tables is None)."""
+        with self._qcache_lock:
+            if tables is None:
+                self._qcache.clear()
+                return
+            hit = frozenset(t.lower() for t in tables)
+            for key in [k for k, v in self._qcache.items() if v[0] & hit]:
+                del self._qcache[key]
+
+    def _note_write(self, sql: str) -> None:
+        heads = {part.lstrip()[:8].split(None, 1)[0].upper() for part in sql.split(";") if part.strip()}
+        if heads.isdisjoint(_WRITE_VERBS):
+            return
+        tables = _sql_tables(sql)
+        self.invalidate_cache(tables)
+        if not tables.isdisjoint(MIRRORED_TABLES):
+            self.mirror.invalidate(tables)
+        # Invalidate again on commit so reads cached mid-transaction don't outlive it
+        pending = getattr(self._tls, "written", None)
+        if pending is None:
+            pending = self._tls.written = set()
+        pending |= tables
+
     def next_quest_id(self) -> int:
-        row = self.fetch_one("SELECT COALESCE(MAX(entry), 0) AS m FROM quest_template")
+        row = self.fetch_one(_SQL_NEXT_QUEST_ID)
         return int(row["m"]) + 1
 
     def create_quest(self, entry: int) -> None:
         # Minimal safe insert; everything else uses table defaults
-        self.execute(
-            """
-            INSERT INTO quest_template
-            (entry, Method, QuestLevel, MinLevel, MaxLevel)
-            VALUES (%s, %s, %s, %s, %s)
-            """,
-            (entry, 2, 1, 1, 1),
-        )
+        self.execute(_SQL_CREATE_QUEST, (entry, 2, 1, 1, 1))
+
+    def create_next_quest(self, id_min: int, id_max: int) -> Optional[int]:
+        """
+        Allocate MAX(entry)+1 within [id_min, id_max] and insert the quest in one statement batch.
+        Returns the new entry, or None if the range is exhausted. Caller commits.
+        """
+        sql = _SQL_CREATE_NEXT_QUEST
+        self._note_write(sql)
+        cur = self._cursor()
+        cur.execute(sql, (id_min, id_min, id_max, id_max))
+        row = None
+        while cur.nextset():
+            row = cur.fetchone() or row
+        if not row or not int(row.get("inserted") or 0):
+            return None
+        return int(row["entry"])
 
     def preview_delete_quest(self, quest_id: int) -> dict:
         quest_id = int(quest_id)
 
-        # Quest-linked condition types where ConditionValue1 = quest_id
-        # NOTE: Do NOT include "2" (ITEM) here. It's not a quest id link.
-        quest_ctypes = (8, 9, 14, 28, 43)
-
-        ph_ct = ",".join(["%s"] * len(quest_ctypes))
-
-        keys = self.fetch_all(
-            f"""
-            SELECT DISTINCT SourceTypeOrReferenceId, SourceGroup, SourceEntry, SourceId
-            FROM conditions
-            WHERE ConditionTypeOrReference IN ({ph_ct})
-              AND ConditionValue1 = %s
-            """,
-            tuple(quest_ctypes) + (quest_id,),
-        )
+        # (st, sg, se, sid, n) tuples
+        keys = self.fetch_tuples(_SQL_QUEST_KEYS_PREVIEW_COUNTED, _QUEST_CTYPES_PREVIEW + (quest_id,))
 
         result = {
             "quest_id": quest_id,
             "anchor_groups": len(keys),
-            "conditions_rows": 0,
+            "conditions_rows": sum(k[4] for k in keys),
             "loot_rows_by_table": {},
         }
 
         if not keys:
             return result
 
-        placeholders = ",".join(["(%s,%s,%s,%s)"] * len(keys))
-        params = []
-        for k in keys:
-            params.extend([
-                int(k["SourceTypeOrReferenceId"]),
-                int(k["SourceGroup"]),
-                int(k["SourceEntry"]),
-                int(k["SourceId"]),
-            ])
-
-        row = self.fetch_one(
-            f"""
-            SELECT COUNT(*) AS n
-            FROM conditions
-            WHERE (SourceTypeOrReferenceId, SourceGroup, SourceEntry, SourceId)
-                  IN ({placeholders})
-            """,
-            tuple(params),
-        )
-        result["conditions_rows"] = int(row["n"])
-
-        by_table = {}
-        for k in keys:
-            table = self._LOOT_TABLE_BY_SOURCE.get(int(k["SourceTypeOrReferenceId"]))
-            if table and int(k["SourceGroup"]) > 0 and int(k["SourceEntry"]) > 0:
-                by_table.setdefault(table, set()).add(
-                    (int(k["SourceGroup"]), int(k["SourceEntry"]))
-                )
-
-        for table, pairs in by_table.items():
-            ph = ",".join(["(%s,%s)"] * len(pairs))
-            p = []
-            for e, i in pairs:
-                p.extend([e, i])
+        _params, by_table = self._split_cond_keys(keys)
 
-            r = self.fetch_one(
-                f"SELECT COUNT(*) AS n FROM {table} WHERE (entry,item) IN ({ph})",
-                tuple(p),
-            )
-            result["loot_rows_by_table"][table] = int(r["n"])
+        # One UNION ALL round trip for every loot table touched
+        if by_table:
+            sql, p = self._loot_pairs_sql("SELECT '{table}' AS t, COUNT(*) AS n FROM {table}", " UNION ALL ", by_table)
+            for r in self.fetch_all(sql, p):
+                result["loot_rows_by_table"][r["t"]] = int(r["n"])
 
         return result
 
@@ -160,86 +533,270 @@ class Database:
     def delete_quest(self, quest_id: int) -> None:
         quest_id = int(quest_id)
 
-        # Quest-linked condition types where ConditionValue1 = quest_id
-        quest_ctypes = (8, 9, 14, 28, 43, 47)
-        ph_ct = ",".join(["%s"] * len(quest_ctypes))
-
-        keys = self.fetch_all(
-            f"""
-            SELECT DISTINCT SourceTypeOrReferenceId, SourceGroup, SourceEntry, SourceId
-            FROM conditions
-            WHERE ConditionTypeOrReference IN ({ph_ct})
-              AND ConditionValue1 = %s
-            """,
-            tuple(quest_ctypes) + (quest_id,),
-        )
+        # (st, sg, se, sid) tuples
+        keys = self.fetch_tuples(_SQL_QUEST_KEYS_DELETE, _QUEST_CTYPES_DELETE + (quest_id,))
 
         if keys:
-            placeholders = ",".join(["(%s,%s,%s,%s)"] * len(keys))
-            params = []
-            for k in keys:
-                params.extend([
-                    int(k["SourceTypeOrReferenceId"]),
-                    int(k["SourceGroup"]),
-                    int(k["SourceEntry"]),
-                    int(k["SourceId"]),
-                ])
+            params, by_table = self._split_cond_keys(keys)
 
             # Delete ALL conditions for those groups (not just the anchor row)
-            self.execute(
-                f"""
-                DELETE FROM conditions
-                WHERE (SourceTypeOrReferenceId, SourceGroup, SourceEntry, SourceId)
-                      IN ({placeholders})
-                """,
-                tuple(params),
-            )
+            if len(keys) > _TEMP_JOIN_THRESHOLD:
+                self._stage_temp_rows(
+                    _SQL_TMP_KEYS_CREATE, _SQL_TMP_KEYS_CLEAR, _SQL_TMP_KEYS_FILL,
+                    [tuple(params[i:i + 4]) for i in range(0, len(params), 4)],
+                )
+                self.execute(_SQL_TMP_KEYS_DELETE_CONDITIONS)
+            else:
+                self.execute(
+                    _SQL_DELETE_CONDITIONS_BY_KEYS + _pair4_ph(len(keys)) + ")",
+                    tuple(params),
+                )
 
             # Delete matching loot rows per SourceType
-            by_table = {}
-            for k in keys:
-                table = self._LOOT_TABLE_BY_SOURCE.get(int(k["SourceTypeOrReferenceId"]))
-                if table and int(k["SourceGroup"]) > 0 and int(k["SourceEntry"]) > 0:
-                    by_table.setdefault(table, set()).add(
-                        (int(k["SourceGroup"]), int(k["SourceEntry"]))
-                    )
-
+            small = {t: pairs for t, pairs in by_table.items() if len(pairs) <= _TEMP_JOIN_THRESHOLD}
+            if small:
+                sql, p = self._loot_pairs_sql("DELETE FROM {table}", ";\n", small)
+                self._multi_exec(sql, p)
             for table, pairs in by_table.items():
-                ph = ",".join(["(%s,%s)"] * len(pairs))
-                p = []
-                for e, i in pairs:
-                    p.extend([e, i])
-
-                self.execute(
-                    f"DELETE FROM {table} WHERE (entry,item) IN ({ph})",
-                    tuple(p),
+                if table in small:
+                    continue
+                self._stage_temp_rows(
+                    _SQL_TMP_PAIRS_CREATE, _SQL_TMP_PAIRS_CLEAR, _SQL_TMP_PAIRS_FILL, list(pairs),
                 )
-
-        # Quest relations
-        self.execute("DELETE FROM creature_quest_starter WHERE quest=%s", (quest_id,))
-        self.execute("DELETE FROM creature_quest_ender WHERE quest=%s", (quest_id,))
-        self.execute("DELETE FROM gameobject_questrelation WHERE quest=%s", (quest_id,))
-        self.execute("DELETE FROM gameobject_involvedrelation WHERE quest=%s", (quest_id,))
-
-        # IMPORTANT: your schema uses quest_template.entry (not Id)
-        self.execute("DELETE FROM quest_template WHERE entry=%s", (quest_id,))
+                self.execute(_SQL_TMP_PAIRS_DELETE.format(table=table))
+
+        # Quest relations + quest_template row
+        self._multi_exec(_SQL_DELETE_QUEST, (quest_id,) * 5)
+
+    def _split_cond_keys(self, keys: Sequence[tuple]) -> Tuple[List[int], Dict[str, set]]:
+        """
+        One pass over condition key tuples (st, sg, se, sid, ...) from fetch_tuples:
+        flat (st, sg, se, sid) params for a tuple-IN, plus loot table -> {(entry, item)}.
+        The driver already decodes the INT columns, so no per-value int() is needed.
+        """
+        params: List[int] = []
+        by_table: Dict[str, set] = {}
+        params_ext = params.extend
+        get_table = self._LOOT_TABLE_BY_SOURCE.get
+        for st, sg, se, sid, *_ in keys:
+            params_ext((st, sg, se, sid))
+            table = get_table(st)
+            if table and sg > 0 and se > 0:
+                pairs = by_table.get(table)
+                if pairs is None:
+                    pairs = by_table[table] = set()
+                pairs.add((sg, se))
+        return params, by_table
+
+    def _stage_temp_rows(self, create_sql: str, clear_sql: str, fill_sql: str, rows: List[tuple]) -> None:
+        """
+        (Re)fill a session temporary table on the transaction's connection.
+        Temporary tables don't force an implicit commit, so this stays inside the caller's transaction.
+        """
+        self._multi_exec(create_sql + ";" + clear_sql)
+        self.executemany(fill_sql, rows)
+
+    @staticmethod
+    def _loot_pairs_sql(head: str, sep: str, by_table: Dict[str, set]) -> Tuple[str, Tuple[Any, ...]]:
+        """
+        Build one statement per loot table filtered by (entry,item) pairs and join them with sep.
+        head may reference {table}.
+        """
+        parts = []
+        p: List[Any] = []
+        for table, pairs in by_table.items():
+            parts.append(head.format(table=table) + " WHERE (entry,item) IN (" + _pair2_ph(len(pairs)) + ")")
+            for e, i in pairs:
+                p.extend([e, i])
+        return sep.join(parts), tuple(p)
+
+    def _multi_exec(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """
+        Run several ';'-separated statements in one round trip.
+        Returns the summed rowcount of all result sets.
+        """
+        return sum(self.execute_multi(sql, params))
+
+    def execute_multi(self, sql: str, params: Sequence[Any] = ()) -> List[int]:
+        """
+        Run several ';'-separated write statements in one round trip (same transaction
+        as execute()). Returns one rowcount per statement; all result sets are drained.
+        """
+        self._note_write(sql)
+        cur = self._cursor()
+        cur.execute(sql, params)
+        counts = [max(cur.rowcount, 0)]
+        while cur.nextset():
+            counts.append(max(cur.rowcount, 0))
+        return counts
 
     def fetch_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[Dict[str, Any]]:
         rows = self.fetch_all(sql, params)
         return rows[0] if rows else None
 
+    def fetch_many_by_keys(
+        self,
+        table: str,
+        key_cols: Sequence[str],
+        keys: Iterable[Sequence[Any]],
+        cols: Sequence[str],
+        chunk_size: int = 500,
+    ) -> Dict[tuple, Dict[str, Any]]:
+        """
+        Rows of table whose composite key is in keys, as {key tuple: row}.
+        One SELECT ... WHERE (k1,k2,...) IN ((...),(...)) per chunk_size keys
+        instead of a fetch_one per key; keys with no row are simply absent.
+        cols must include key_cols.
+        """
+        keys = [tuple(k) for k in keys]
+        out: Dict[tuple, Dict[str, Any]] = {}
+        if not keys:
+            return out
+        key_list = ",".join(key_cols)
+        tuple_ph = f"({_ph(len(key_cols))})"
+        head = f"SELECT {', '.join(cols)} FROM {table} WHERE ({key_list}) IN "
+        for i in range(0, len(keys), chunk_size):
+            chunk = keys[i:i + chunk_size]
+            sql = head + "(" + ",".join([tuple_ph] * len(chunk)) + ")"
+            for r in self.fetch_all(sql, [v for k in chunk for v in k]):
+                out[tuple(r[c] for c in key_cols)] = r
+        return out
+
     def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
-        with self.conn.cursor() as cur:
-            cur.execute(sql, params)
-            return cur.rowcount
+        self._note_write(sql)
+        cur = self._cursor()
+        cur.execute(sql, params)
+        return cur.rowcount
 
     def executemany(self, sql: str, seq_params: Iterable[Sequence[Any]]) -> int:
-        with self.conn.cursor() as cur:
-            cur.executemany(sql, seq_params)
-            return cur.rowcount
+        self._note_write(sql)
+        cur = self._cursor()
+        cur.executemany(sql, seq_params)
+        return cur.rowcount
+
+    def insert_many(
+        self, head: str, rows: Sequence[Sequence[Any]], chunk_size: int = 500
+    ) -> int:
+        """
+        Multi-row INSERT: head is "INSERT INTO t (cols) VALUES" (optionally with
+        IGNORE); rows are sent as one VALUES (...),(...) list per chunk_size rows,
+        so each chunk is one round trip regardless of the driver's executemany
+        rewrite and stays well under max_allowed_packet.
+        """
+        if not rows:
+            return 0
+        row_ph = _ph(len(rows[0]))
+        total = 0
+        for i in range(0, len(rows), chunk_size):
+            chunk = rows[i:i + chunk_size]
+            sql = f"{head} " + ",".join([f"({row_ph})"] * len(chunk))
+            total += max(self.execute(sql, [v for r in chunk for v in r]), 0)
+        return total
 
     def commit(self) -> None:
-        self.conn.commit()
+        c = getattr(self._tls, "conn", None) or self._conn
+        if c is None:
+            return
+        try:
+            c.commit()
+        finally:
+            self._release()
 
     def rollback(self) -> None:
-        self.conn.rollback()
+        c = getattr(self._tls, "conn", None) or self._conn
+        if c is None:
+            return
+        try:
+            c.rollback()
+        finally:
+            self._release()
+
+
+class TxnBuffer(QtCore.QObject):
+    """
+    Write statements staged by several editors and committed together:
+    flush() runs everything in one transaction on a worker (one COMMIT for N rows).
+    Statements are keyed (e.g. (table, entry, item)) so re-saving a row replaces
+    its pending write instead of queueing a second one.
+    """
+
+    pendingChanged = QtCore.pyqtSignal(int)
+    flushed = QtCore.pyqtSignal(int)            # statements committed
+    flushFailed = QtCore.pyqtSignal(object)     # exception; the batch is staged again
+
+    def __init__(self, db: Database, max_pending: int = 32, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.db = db
+        self.max_pending = max_pending
+        self._staged: "OrderedDict[Any, Tuple[str, Sequence[Any]]]" = OrderedDict()
+        self._flushing = False
+        self._inflight: List[Any] = []
+
+    @property
+    def pending(self) -> int:
+        return len(self._staged)
+
+    def pending_keys(self) -> List[Any]:
+        return list(self._staged)
+
+    def inflight_keys(self) -> List[Any]:
+        """Keys of the batch being committed; empty once flushed/flushFailed fires."""
+        return list(self._inflight)
+
+    @property
+    def flushing(self) -> bool:
+        """A batch is committing on a worker; flushed/flushFailed will follow."""
+        return self._flushing
+
+    def stage(self, key: Any, sql: str, params: Sequence[Any]) -> None:
+        self._staged.pop(key, None)
+        self._staged[key] = (sql, params)
+        self.pendingChanged.emit(len(self._staged))
+        if len(self._staged) > self.max_pending:
+            self.flush()
+
+    def discard(self, key: Any) -> None:
+        if self._staged.pop(key, None) is not None:
+            self.pendingChanged.emit(len(self._staged))
+
+    def flush(self) -> None:
+        if self._flushing or not self._staged:
+            return
+        batch = list(self._staged.items())
+        self._staged.clear()
+        self._inflight = [key for key, _stmt in batch]
+        self._flushing = True
+        self.pendingChanged.emit(0)
+
+        def run() -> int:
+            try:
+                for _key, (sql, params) in batch:
+                    self.db.execute(sql, params)
+                self.db.commit()
+            except Exception:
+                try:
+                    self.db.rollback()
+                except Exception:
+                    pass
+                raise
+            return len(batch)
+
+        def done(n: int) -> None:
+            self._flushing = False
+            self._inflight = []
+            self.flushed.emit(n)
+            # anything staged while the batch was in flight
+            if len(self._staged) > self.max_pending:
+                self.flush()
+
+        def failed(e: Exception) -> None:
+            self._flushing = False
+            self._inflight = []
+            # Put the batch back (newer stagings of the same key win) so the user can retry
+            for key, stmt in batch:
+                if key not in self._staged:
+                    self._staged[key] = stmt
+            self.pendingChanged.emit(len(self._staged))
+            self.flushFailed.emit(e)
+
+        self.db.submit(run, on_done=done, on_error=failed)
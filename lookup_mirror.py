@@ -0,0 +1,91 @@
+from __future__ import annotations
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+
+# table -> (MySQL SELECT to mirror, SQLite DDL, SQLite INSERT)
+MIRRORED_TABLES: Dict[str, Tuple[str, str, str]] = {
+    "quest_template": (
+        "SELECT entry, Title, MinLevel FROM quest_template",
+        "CREATE TABLE quest_template (entry INTEGER PRIMARY KEY, Title TEXT, MinLevel INTEGER)",
+        "INSERT INTO quest_template (entry, Title, MinLevel) VALUES (?, ?, ?)",
+    ),
+}
+
+# Seconds a loaded table is trusted; picks up writes made by other tools.
+MIRROR_TTL = 300.0
+
+
+def _dict_row(cur: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    return {d[0]: v for d, v in zip(cur.description, row)}
+
+
+class LookupMirror:
+    """
+    In-memory SQLite copy of near-static lookup tables (quest headers for search, etc.).
+
+    Tables are never loaded on demand: callers check ready() and fall back to MySQL
+    until a refresh() (run on a worker) has finished. A table stops being ready when
+    Database sees a write to it or after MIRROR_TTL seconds.
+    """
+
+    def __init__(
+        self,
+        iter_rows: Callable[[str, Sequence[Any]], Iterator[Dict[str, Any]]],
+        ttl: float = MIRROR_TTL,
+    ):
+        self._iter_rows = iter_rows
+        self._ttl = ttl
+        self._sq = sqlite3.connect(":memory:", check_same_thread=False)
+        self._sq.row_factory = _dict_row
+        self._lock = threading.Lock()
+        self._loaded_at: Dict[str, float] = {}
+        # bumped on every invalidate, so a load that raced a write is not marked fresh
+        self._gen: Dict[str, int] = {}
+        self._loading: set = set()
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        with self._lock:
+            for t in tables:
+                t = t.lower()
+                self._loaded_at.pop(t, None)
+                self._gen[t] = self._gen.get(t, 0) + 1
+
+    def ready(self, table: str) -> bool:
+        with self._lock:
+            at = self._loaded_at.get(table)
+            return at is not None and time.monotonic() - at < self._ttl
+
+    def refresh(self, table: str) -> bool:
+        """
+        Re-pull a mirrored table from MySQL. Blocking; run it on a worker.
+        Rows are fetched without holding the lock, so searches keep working meanwhile.
+        Returns False if another refresh is running or the table was written mid-load.
+        """
+        with self._lock:
+            if table in self._loading:
+                return False
+            self._loading.add(table)
+            gen = self._gen.get(table, 0)
+        try:
+            select_sql, ddl, insert_sql = MIRRORED_TABLES[table]
+            rows = [tuple(r.values()) for r in self._iter_rows(select_sql, ())]
+            with self._lock:
+                if self._gen.get(table, 0) != gen:
+                    return False
+                self._sq.execute(f"DROP TABLE IF EXISTS {table}")
+                self._sq.execute(ddl)
+                self._sq.executemany(insert_sql, rows)
+                self._sq.commit()
+                self._loaded_at[table] = time.monotonic()
+                return True
+        finally:
+            with self._lock:
+                self._loading.discard(table)
+
+    def execute(self, table: str, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """Run a read-only SQLite query (qmark params) against a mirrored table; check ready() first."""
+        with self._lock:
+            return self._sq.execute(sql, tuple(params)).fetchall()
@@ -3,7 +3,7 @@
 # Tabs are grouped for sanity: Core, Text, Objectives, Requirements, Rewards, Reputation, Currency, Scripts/Sounds, Misc.
 
 from __future__ import annotations
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 Field = Tuple[str, str, str]          # (column, label, ftype)
 Tab = Tuple[str, List[Field]]         # (tab_name, fields)
@@ -334,9 +334,24 @@ QUEST_TABS: List[Tab] = [
     (
         "Misc",
         [
-            ("RewRepMask", "Reward Rep Mask", "int"),
             ("unk0", "unk0", "int"),
             ("WDBVerified", "WDB Verified", "int"),
         ],
     ),
 ]
+
+
+# Every column must appear in exactly one tab (one widget per column)
+_seen: set = set()
+for _tab, _fields in QUEST_TABS:
+    for _col, _, _ in _fields:
+        if _col in _seen:
+            raise ValueError(f"QUEST_TABS: duplicate column {_col!r} (tab {_tab!r})")
+        _seen.add(_col)
+del _seen, _tab, _fields, _col
+
+# Flat per-column views of QUEST_TABS (built once at import; treat as read-only)
+COL_TO_FTYPE: Dict[str, str] = {col: ft for _, fields in QUEST_TABS for col, _, ft in fields}
+COL_TO_LABEL: Dict[str, str] = {col: lbl for _, fields in QUEST_TABS for col, lbl, _ in fields}
+COL_TO_TAB: Dict[str, str] = {col: tab for tab, fields in QUEST_TABS for col, _, _ in fields}
+ALL_COLS: Tuple[str, ...] = tuple(COL_TO_FTYPE)
@@ -15,3 +15,12 @@ class BusyOverlay(QtWidgets.QWidget):
         super().__init__(parent)
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         self.hide()
+
+
+def show_status(widget: QtWidgets.QWidget, msg: str, msecs: int = 3000) -> bool:
+    """Show msg on the status bar of widget's main window; False if it has none."""
+    win = widget.window()
+    if isinstance(win, QtWidgets.QMainWindow):
+        win.statusBar().showMessage(msg, msecs)
+        return True
+    return False
@@ -1,6 +1,60 @@
 from __future__ import annotations
-from typing import Callable, Dict
+import functools
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 from PyQt6 import QtWidgets
+from PyQt6.QtCore import Qt, QSignalBlocker
+
+from db import LOOT_TABLES
+from widgets.common import show_status
+
+
+class _LootSQL(NamedTuple):
+    select: str
+    upsert: str
+    delete: str
+
+
+@functools.lru_cache(maxsize=None)
+def _loot_sql(table_name: str) -> _LootSQL:
+    """
+    SQL text for one *_loot_template table, generated from LOOT_COLS once per table
+    name so every click sends byte-identical statements (and reuses the same str objects).
+    table_name is interpolated, so it must be one of db.LOOT_TABLES.
+    """
+    if table_name not in LOOT_TABLES:
+        raise ValueError(f"not a loot template table: {table_name!r}")
+    cols = GenericLootEditor.LOOT_COLS
+    key = ("entry", "item")
+    col_list = ",".join(cols)
+    ph = ",".join(["%s"] * len(cols))
+    # VALUES(col) rather than MySQL 8's "AS new" row alias: Cata-era cores
+    # commonly run on MySQL 5.x / MariaDB, which do not accept the alias.
+    updates = ",\n              ".join(f"{c}=VALUES({c})" for c in cols if c not in key)
+    # Always returns one row: the stored values, or _LOOT_DEFAULTS when there is no
+    # loot row yet (found = 0). Loot columns are NOT NULL, so COALESCE only fills misses.
+    defaults = GenericLootEditor._LOOT_DEFAULTS
+    select_cols = ",\n              ".join(
+        ["k.e AS entry", "k.i AS item"]
+        + [f"COALESCE(l.{c}, {defaults[c]!r}) AS {c}" for c in cols if c not in key]
+        + ["l.entry IS NOT NULL AS found"]
+    )
+    return _LootSQL(
+        select=f"""
+            SELECT
+              {select_cols}
+            FROM (SELECT %s AS e, %s AS i) k
+            LEFT JOIN {table_name} l ON l.entry = k.e AND l.item = k.i
+            """,
+        upsert=f"""
+            INSERT INTO {table_name}
+              ({col_list})
+            VALUES ({ph})
+            ON DUPLICATE KEY UPDATE
+              {updates}
+            """,
+        delete=f"DELETE FROM {table_name} WHERE entry=%s AND item=%s",
+    )
 
 
 class GenericLootEditor(QtWidgets.QWidget):
@@ -9,7 +63,7 @@ class GenericLootEditor(QtWidgets.QWidget):
       (entry, item, ChanceOrQuestChance, lootmode, groupid, mincountOrRef, maxcount)
     """
 
-    LOOT_COLS = [
+    LOOT_COLS = (
         "entry",
         "item",
         "ChanceOrQuestChance",
@@ -17,154 +71,355 @@ class GenericLootEditor(QtWidgets.QWidget):
         "groupid",
         "mincountOrRef",
         "maxcount",
-    ]
+    )
+
+    # Per-column value type (picks the spin box kind; converts values read from the DB)
+    LOOT_COL_TYPES: Dict[str, Callable[..., Any]] = {
+        "entry": int,
+        "item": int,
+        "ChanceOrQuestChance": float,
+        "lootmode": int,
+        "groupid": int,
+        "mincountOrRef": int,
+        "maxcount": int,
+    }
 
-    def __init__(self, db, log: Callable[[str], None], table_name: str, parent=None):
+    # LOOT_COL_TYPES in LOOT_COLS order, for positional row handling
+    _COL_CONVS = tuple(map(LOOT_COL_TYPES.__getitem__, LOOT_COLS))
+
+    # Rows kept in the per-editor LRU cache (large enough for one quest's prefetch)
+    CACHE_MAX = 256
+
+    # Values for a new row (quest drop: negative chance = quest-only item)
+    _LOOT_DEFAULTS: Dict[str, Any] = {
+        "ChanceOrQuestChance": -100.0,
+        "lootmode": 1,
+        "groupid": 0,
+        "mincountOrRef": 1,
+        "maxcount": 1,
+    }
+
+    def __init__(self, db, log: Callable[[str], None], table_name: str, parent=None, txn=None):
         super().__init__(parent)
         self.db = db
         self.log = log
         self.table_name = table_name
+        # Optional shared db.TxnBuffer: save() stages the upsert instead of committing it
+        self.txn = txn
+        self._sql = _loot_sql(table_name)
 
         self._entry = 0
         self._item = 0
+        # (entry, item) -> last row read from / written to this table by this editor (LRU)
+        # Rows are tuples in LOOT_COLS order.
+        self._loot_cache: "OrderedDict[Tuple[int, int], Tuple[Any, ...]]" = OrderedDict()
+        self._db_jobs = 0
+        # Form differs from what the server has for (entry, item); save() is a no-op otherwise
+        self._dirty = True
+
+        # Widgets are built on first show (_ensure_ui): loot tabs the user never
+        # opens cost no Qt objects.
+        self.inputs: Dict[str, QtWidgets.QAbstractSpinBox] = {}
+        self._input_list: List[QtWidgets.QAbstractSpinBox] = []   # same widgets, LOOT_COLS order
+        self._db_buttons: Tuple[QtWidgets.QPushButton, ...] = ()
+        self._ui_built = False
+
+        if txn is not None:
+            txn.flushFailed.connect(self._on_txn_flush_failed)
 
-        form = QtWidgets.QFormLayout()
-        self.inputs: Dict[str, QtWidgets.QLineEdit] = {}
+    def showEvent(self, event) -> None:
+        self._ensure_ui()
+        super().showEvent(event)
 
-        for col in self.LOOT_COLS:
-            le = QtWidgets.QLineEdit()
-            le.setPlaceholderText(col)
+    def _ensure_ui(self) -> None:
+        if self._ui_built:
+            return
+        self._ui_built = True
+
+        grid = QtWidgets.QGridLayout()
+        # Typed spin boxes: Qt validates input and value() is already an int/float
+        for r, col in enumerate(self.LOOT_COLS):
+            if self.LOOT_COL_TYPES[col] is float:
+                sb = QtWidgets.QDoubleSpinBox()
+                sb.setDecimals(4)
+                sb.setRange(-100.0, 100.0)
+            else:
+                sb = QtWidgets.QSpinBox()
+                sb.setRange(-2147483648, 2147483647)
+            sb.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+            sb.setToolTip(col)
+            sb.setValue(self._LOOT_DEFAULTS.get(col, 0))
             if col in ("entry", "item"):
-                le.setEnabled(False)
-            self.inputs[col] = le
-            form.addRow(col + ":", le)
+                sb.setEnabled(False)
+            else:
+                # Only user edits: programmatic fills run under QSignalBlocker
+                sb.valueChanged.connect(self._mark_dirty)
+            self.inputs[col] = sb
+            self._input_list.append(sb)
+            grid.addWidget(QtWidgets.QLabel(col + ":"), r, 0, Qt.AlignmentFlag.AlignRight)
+            grid.addWidget(sb, r, 1)
+        self.inputs["entry"].setValue(self._entry)
+        self.inputs["item"].setValue(self._item)
 
         btn_load = QtWidgets.QPushButton("Load")
-        btn_new = QtWidgets.QPushButton("Create (if missing)")
         btn_save = QtWidgets.QPushButton("Save")
         btn_del = QtWidgets.QPushButton("Delete")
         btn_clr = QtWidgets.QPushButton("Clear")
 
-        btn_load.clicked.connect(self.load_current)
-        btn_new.clicked.connect(self.create_if_missing)
+        btn_load.clicked.connect(self.reload)
         btn_save.clicked.connect(self.save)
         btn_del.clicked.connect(self.delete)
         btn_clr.clicked.connect(self.clear)
+        self._db_buttons = (btn_load, btn_save, btn_del)
+        self._set_buttons_enabled(self._db_jobs == 0)
 
         btns = QtWidgets.QHBoxLayout()
         btns.addWidget(btn_load)
-        btns.addWidget(btn_new)
         btns.addStretch(1)
         btns.addWidget(btn_del)
         btns.addWidget(btn_clr)
         btns.addWidget(btn_save)
 
         wrap = QtWidgets.QVBoxLayout()
-        wrap.addLayout(form)
+        wrap.addLayout(grid)
         wrap.addSpacing(8)
         wrap.addLayout(btns)
         wrap.addStretch(1)
         self.setLayout(wrap)
 
+    def _info(self, msg: str) -> None:
+        """Recoverable, informational: log + status bar instead of a modal box."""
+        self.log(msg)
+        show_status(self, msg)
+
+    def _mark_dirty(self, *_: Any) -> None:
+        self._dirty = True
+
     def set_key(self, entry: int, item: int) -> None:
+        if (int(entry or 0), int(item or 0)) != (self._entry, self._item):
+            self._dirty = True  # form no longer known to match the server row
         self._entry = int(entry or 0)
         self._item = int(item or 0)
-        self.inputs["entry"].setText(str(self._entry))
-        self.inputs["item"].setText(str(self._item))
+        if self._ui_built:
+            self.inputs["entry"].setValue(self._entry)
+            self.inputs["item"].setValue(self._item)
 
     def clear(self) -> None:
-        for c in self.LOOT_COLS:
-            if c in ("entry", "item"):
+        """Reset the non-key fields to _LOOT_DEFAULTS (spin boxes have no blank state)."""
+        if not self._ui_built:
+            return  # built with the defaults already
+        for c, v in self._LOOT_DEFAULTS.items():
+            w = self.inputs[c]
+            if w.value() != v:
+                with QSignalBlocker(w):
+                    w.setValue(v)
+                self._dirty = True
+
+    def _values_list(self) -> List[Any]:
+        """Form values in LOOT_COLS order: directly the upsert's bind parameters."""
+        self._ensure_ui()
+        return [w.value() for w in self._input_list]
+
+    def fetch_rows(self, keys: Iterable[Tuple[int, int]]) -> Dict[Tuple[int, int], Dict[str, Any]]:
+        """DB only (safe on a worker thread): existing rows for many (entry,item) keys in one query."""
+        return self.db.fetch_many_by_keys(self.table_name, ("entry", "item"), keys, self.LOOT_COLS)
+
+    def prime_cache(self, keys: Iterable[Tuple[int, int]], rows: Dict[Tuple[int, int], Dict[str, Any]]) -> None:
+        """Store a fetch_rows() result; requested keys without a row are dropped from the cache."""
+        # Rows with a staged or still-committing save keep the cached form values;
+        # the server copy read here may predate that commit
+        staged = set(self.txn.pending_keys()) | set(self.txn.inflight_keys()) if self.txn is not None else set()
+        for key in keys:
+            if (self.table_name, *key) in staged:
                 continue
-            self.inputs[c].setText("")
+            row = rows.get(key)
+            if row is None:
+                self._loot_cache.pop(key, None)
+            else:
+                self._cache_put(key, tuple(row[c] for c in self.LOOT_COLS))
+
+    def invalidate(self, entry: int, item: int) -> None:
+        """Forget the cached row for (entry, item), e.g. after it was deleted elsewhere."""
+        self._loot_cache.pop((int(entry), int(item)), None)
+
+    def _on_txn_flush_failed(self, _e: Exception) -> None:
+        """Staged rows never reached the server: stop treating their cached values as stored."""
+        for table, entry, item in self.txn.pending_keys():
+            if table != self.table_name:
+                continue
+            self.invalidate(entry, item)
+            if (entry, item) == (self._entry, self._item):
+                self._dirty = True  # the form still shows the unsaved values
+
+    def reload(self) -> None:
+        """Load button: bypass the cache so edits made by other tools show up."""
+        staged_key = (self.table_name, self._entry, self._item)
+        if self.txn is not None and staged_key in self.txn.pending_keys():
+            ok = QtWidgets.QMessageBox.question(
+                self, "Discard pending save",
+                f"{self.table_name} entry={self._entry} item={self._item} has a staged save "
+                "that is not written yet.\n\nDiscard it and load the stored row?"
+            )
+            if ok != QtWidgets.QMessageBox.StandardButton.Yes:
+                return
+            # otherwise the next flush would write the discarded values anyway
+            self.txn.discard(staged_key)
+        self._loot_cache.pop((self._entry, self._item), None)
+        self.load_current()
 
-    def _values(self) -> Dict[str, int]:
-        out: Dict[str, int] = {}
-        for c in self.LOOT_COLS:
-            t = (self.inputs[c].text() or "").strip()
+    def _cache_get(self, key: Tuple[int, int]) -> Optional[Tuple[Any, ...]]:
+        row = self._loot_cache.get(key)
+        if row is not None:
+            self._loot_cache.move_to_end(key)
+        return row
+
+    def _cache_put(self, key: Tuple[int, int], row: Tuple[Any, ...]) -> None:
+        self._loot_cache[key] = row
+        self._loot_cache.move_to_end(key)
+        while len(self._loot_cache) > self.CACHE_MAX:
+            self._loot_cache.popitem(last=False)
+
+    def _run_db_job(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_done: Callable[[Any], None],
+        on_error: Callable[[Exception], None],
+    ) -> None:
+        """
+        Run a DB call off the GUI thread (Database.submit); callbacks run on the GUI
+        thread. The buttons stay disabled while any job is in flight (no double submits).
+        fn must not touch widgets.
+        """
+        self._db_jobs += 1
+        self._set_buttons_enabled(False)
+
+        def finish() -> None:
+            self._db_jobs -= 1
+            if self._db_jobs == 0:
+                self._set_buttons_enabled(True)
+
+        def done(res: Any) -> None:
+            finish()
+            on_done(res)
+
+        def failed(e: Exception) -> None:
+            finish()
+            on_error(e)
+
+        self.db.submit(fn, *args, on_done=done, on_error=failed)
+
+    def _in_txn(self, sql: str, params: Sequence[Any]) -> int:
+        """Worker side: execute + commit; rollback (same thread/connection) on error."""
+        try:
+            n = self.db.execute(sql, params)
+            self.db.commit()
+            return n
+        except Exception:
             try:
-                out[c] = int(t) if t else 0
+                self.db.rollback()
             except Exception:
-                out[c] = 0
-        return out
+                pass
+            raise
+
+    def _set_buttons_enabled(self, on: bool) -> None:
+        for b in self._db_buttons:
+            b.setEnabled(on)
+
+    def _fill(self, row: Sequence[Any]) -> None:
+        """row: values in LOOT_COLS order (positional, no per-column lookups)."""
+        self._ensure_ui()
+        defaults = self._LOOT_DEFAULTS
+        for w, conv, c, v in zip(self._input_list, self._COL_CONVS, self.LOOT_COLS, row):
+            # DB values may arrive as Decimal; NULL shows the column default
+            new = conv(v) if v is not None else defaults.get(c, 0)
+            # Re-selecting the same row is the common case: leave matching fields alone
+            if w.value() == new:
+                continue
+            with QSignalBlocker(w):
+                w.setValue(new)
 
     def load_current(self) -> None:
         if self._entry <= 0 or self._item <= 0:
-            QtWidgets.QMessageBox.information(self, "Missing key", "Select a condition row with SourceGroup/SourceEntry first.")
+            self._info("Select a condition row with SourceGroup/SourceEntry first.")
             return
-        try:
-            cols = ", ".join(self.LOOT_COLS)
-            row = self.db.fetch_one(
-                f"SELECT {cols} FROM {self.table_name} WHERE entry=%s AND item=%s",
-                (self._entry, self._item),
-            )
-            if not row:
-                QtWidgets.QMessageBox.information(
-                    self, "No loot row",
-                    f"No {self.table_name} row exists for this (entry,item).\n\nUse 'Create (if missing)' first."
-                )
-                self.clear()
+        key = (self._entry, self._item)
+        row = self._cache_get(key)
+        if row is not None:
+            self._fill(row)
+            self._dirty = False
+            self.log(f"Loaded {self.table_name} entry={self._entry} item={self._item}")
+            return
+
+        def done(rows: List[tuple]) -> None:
+            # The selection moved on while the SELECT was in flight
+            if key != (self._entry, self._item):
                 return
+            # (*LOOT_COLS, found)
+            *vals, found = rows[0] if rows else (*key, *[None] * (len(self.LOOT_COLS) - 2), 0)
+            row = tuple(vals)
+            if found:
+                self._cache_put(key, row)
+            self._fill(row)
+            # A defaults row for a missing loot row still needs saving
+            self._dirty = not found
+            if found:
+                self.log(f"Loaded {self.table_name} entry={key[0]} item={key[1]}")
+            else:
+                self._info(
+                    f"No {self.table_name} row for entry={key[0]} item={key[1]}: "
+                    "form filled with defaults (Save creates it)."
+                )
 
-            for c in self.LOOT_COLS:
-                self.inputs[c].setText(str(row.get(c, 0)))
-            self.log(f"Loaded {self.table_name} entry={self._entry} item={self._item}")
-        except Exception as e:
+        def failed(e: Exception) -> None:
             QtWidgets.QMessageBox.critical(self, "Load failed", str(e))
             self.log(f"ERROR loading {self.table_name}: {e}")
 
+        # One round trip: the stored row, or a defaults row when it doesn't exist
+        self._run_db_job(self.db.fetch_tuples, self._sql.select, key, on_done=done, on_error=failed)
+
     def create_if_missing(self) -> None:
-        if self._entry <= 0 or self._item <= 0:
-            QtWidgets.QMessageBox.information(self, "Missing key", "Select a condition row with SourceGroup/SourceEntry first.")
-            return
-        try:
-            self.db.execute(
-                f"INSERT IGNORE INTO {self.table_name} (entry,item,ChanceOrQuestChance,lootmode,groupid,mincountOrRef,maxcount) "
-                "VALUES (%s,%s,0,0,0,0,0)",
-                (self._entry, self._item),
-            )
-            self.db.commit()
-            self.log(f"Ensured {self.table_name} row exists entry={self._entry} item={self._item}")
-        except Exception as e:
-            self.db.rollback()
-            QtWidgets.QMessageBox.critical(self, "Create failed", str(e))
-            self.log(f"ERROR creating {self.table_name} row: {e}")
+        """Kept for callers: the upsert in save() already creates missing rows."""
+        self.save()
 
     def save(self) -> None:
-        v = self._values()
-        if v["entry"] <= 0 or v["item"] <= 0:
-            QtWidgets.QMessageBox.information(self, "Missing key", "Select a condition row with SourceGroup/SourceEntry first.")
+        """Create-or-update in one statement (and one COMMIT): missing rows get the form values."""
+        params = self._values_list()
+        entry, item = params[0], params[1]  # LOOT_COLS starts with the key
+        if entry <= 0 or item <= 0:
+            self._info("Select a condition row with SourceGroup/SourceEntry first.")
             return
-        try:
-            sql = f"""
-            INSERT INTO {self.table_name}
-              (entry,item,ChanceOrQuestChance,lootmode,groupid,mincountOrRef,maxcount)
-            VALUES (%s,%s,%s,%s,%s,%s,%s)
-            ON DUPLICATE KEY UPDATE
-              ChanceOrQuestChance=VALUES(ChanceOrQuestChance),
-              lootmode=VALUES(lootmode),
-              groupid=VALUES(groupid),
-              mincountOrRef=VALUES(mincountOrRef),
-              maxcount=VALUES(maxcount)
-            """
-            self.db.execute(sql, (
-                v["entry"], v["item"],
-                v["ChanceOrQuestChance"],
-                v["lootmode"],
-                v["groupid"],
-                v["mincountOrRef"],
-                v["maxcount"],
-            ))
-            self.db.commit()
-            self.log(f"Saved {self.table_name} entry={v['entry']} item={v['item']}")
-        except Exception as e:
-            self.db.rollback()
+        key = (entry, item)
+        if not self._dirty:
+            self.log(f"No changes to save for {self.table_name} entry={entry} item={item}")
+            return
+
+        if self.txn is not None:
+            # Committed with the other editors' pending rows on the next flush
+            self.txn.stage((self.table_name, entry, item), self._sql.upsert, params)
+            self._cache_put(key, tuple(params))
+            self._dirty = False
+            self.log(f"Staged {self.table_name} entry={entry} item={item} (pending save)")
+            return
+
+        def done(n: int) -> None:
+            # ON DUPLICATE KEY UPDATE rowcount: 1 = inserted, 2 = updated, 0 = no change
+            # What we just wrote is what the server has: no re-SELECT on the next load
+            self._cache_put(key, tuple(params))
+            if key == (self._entry, self._item) and self._values_list() == params:
+                self._dirty = False
+            what = {1: "Created", 2: "Saved"}.get(n, "Unchanged:")
+            self.log(f"{what} {self.table_name} entry={entry} item={item}")
+
+        def failed(e: Exception) -> None:
             QtWidgets.QMessageBox.critical(self, "Save failed", str(e))
             self.log(f"ERROR saving {self.table_name} row: {e}")
 
+        self._run_db_job(self._in_txn, self._sql.upsert, params, on_done=done, on_error=failed)
+
     def delete(self) -> None:
         if self._entry <= 0 or self._item <= 0:
-            QtWidgets.QMessageBox.information(self, "Missing key", "Select a condition row with SourceGroup/SourceEntry first.")
+            self._info("Select a condition row with SourceGroup/SourceEntry first.")
             return
 
         ok = QtWidgets.QMessageBox.question(
@@ -174,15 +429,20 @@ class GenericLootEditor(QtWidgets.QWidget):
         if ok != QtWidgets.QMessageBox.StandardButton.Yes:
             return
 
-        try:
-            self.db.execute(
-                f"DELETE FROM {self.table_name} WHERE entry=%s AND item=%s",
-                (self._entry, self._item),
-            )
-            self.db.commit()
-            self.clear()
-            self.log(f"Deleted {self.table_name} entry={self._entry} item={self._item}")
-        except Exception as e:
-            self.db.rollback()
+        key = (self._entry, self._item)
+        if self.txn is not None:
+            # A pending upsert would bring the row back on the next flush
+            self.txn.discard((self.table_name, *key))
+
+        def done(_n: int) -> None:
+            self._loot_cache.pop(key, None)
+            if key == (self._entry, self._item):
+                self.clear()
+                self._dirty = True  # the row is gone: saving the form recreates it
+            self.log(f"Deleted {self.table_name} entry={key[0]} item={key[1]}")
+
+        def failed(e: Exception) -> None:
             QtWidgets.QMessageBox.critical(self, "Delete failed", str(e))
             self.log(f"ERROR deleting {self.table_name}: {e}")
+
+        self._run_db_job(self._in_txn, self._sql.delete, key, on_done=done, on_error=failed)
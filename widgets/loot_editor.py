@@ -1,19 +1,37 @@
 from __future__ import annotations
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
+import bisect
+import functools
+import itertools
+import mmap
+import os
+import re
 import struct
 
+try:
+    import numpy as np
+except Exception:
+    np = None  # pure-Python WDBC parsing fallback
+
 try:
     import config
 except Exception:
     config = None
 
 
-from PyQt6 import QtWidgets
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6 import QtCore, QtGui, QtWidgets
+from PyQt6.QtCore import Qt, QSignalBlocker, QTimer
 
+from db import TxnBuffer
+from widgets.common import show_status
 from widgets.generic_loot_editor import GenericLootEditor
 
+# any letter (Unicode-aware, like str.isalpha); used to spot name-like strings
+_ALPHA_RE = re.compile(r"[^\W\d_]").search
+# sanity bound for WDBC record width (Spell.dbc, the widest, is well below this)
+_WDBC_MAX_FIELDS = 512
+
 def load_wdbc_id_name(
     path: str,
     *,
@@ -26,65 +44,191 @@ def load_wdbc_id_name(
     - ID is fields[0]
     - Name is a string offset at some field index.
     If name_field_index isn't provided, we guess it by scanning candidate fields.
+    Parses are cached per (path, mtime, size), so reopening a picker is free
+    until the file changes on disk.
+    """
+    st = os.stat(path)
+    return list(_load_wdbc_id_name_cached(
+        os.path.abspath(path),
+        st.st_mtime_ns,
+        st.st_size,
+        name_field_index,
+        tuple(candidate_name_fields) if candidate_name_fields else None,
+        max_rows_scan,
+    ))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_wdbc_id_name_cached(
+    path: str,
+    _mtime_ns: int,
+    _size: int,
+    name_field_index: Optional[int],
+    candidate_name_fields: Optional[Tuple[int, ...]],
+    max_rows_scan: int,
+) -> Tuple[Tuple[int, str], ...]:
+    """
+    The actual load behind load_wdbc_id_name; mtime/size are only part of the key.
+    The file is memory-mapped for the duration of the parse and closed after,
+    so a cache miss always reads the file as it is now.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return _parse_wdbc_id_name(mm, path, name_field_index, candidate_name_fields, max_rows_scan)
+    finally:
+        mm.close()
+
+
+def _parse_wdbc_id_name(
+    data,
+    path: str,
+    name_field_index: Optional[int],
+    candidate_name_fields: Optional[Tuple[int, ...]],
+    max_rows_scan: int,
+) -> Tuple[Tuple[int, str], ...]:
+    """
+    Parse a WDBC image (bytes or mmap). Everything returned is copied out.
+    With numpy installed the record block is read as one zero-copy uint32 matrix.
     """
-    data = Path(path).read_bytes()
     if data[:4] != b"WDBC":
         raise ValueError(f"Not a valid WDBC file. Magic={data[:4]!r}")
+    if len(data) < 20:
+        raise ValueError(f"Truncated WDBC header ({len(data)} bytes): {path}")
 
     _magic, rec_count, field_count, rec_size, str_size = struct.unpack_from("<4s4I", data, 0)
     records_off = 20
     strings_off = records_off + rec_count * rec_size
-    string_block = data[strings_off : strings_off + str_size]
+
+    # Fail fast on corrupt geometry, before sizing any struct format or array
+    if rec_size < 4 or rec_size // 4 > _WDBC_MAX_FIELDS:
+        raise ValueError(f"Corrupt WDBC record size {rec_size} (field_count={field_count}): {path}")
+    if strings_off + str_size > len(data):
+        raise ValueError(
+            f"Corrupt WDBC: {rec_count} records of {rec_size} bytes + {str_size} string bytes "
+            f"exceed file size {len(data)}: {path}"
+        )
+    # latin-1 maps bytes 1:1 to chars, so byte offsets index the decoded text
+    # directly; the whole block is decoded once instead of once per name
+    with memoryview(data) as mv:
+        string_text = str(mv[strings_off : strings_off + str_size], "latin-1")
+    block_len = len(string_text)
 
     ints_per_record = rec_size // 4
+    unpack_rec = struct.Struct("<" + "I" * ints_per_record).unpack_from
+
+    # many rows share one string offset; resolve each offset once
+    cstr_cache: Dict[int, str] = {}
 
     def read_cstr(off: int) -> str:
-        if off <= 0 or off >= len(string_block):
-            return ""
-        end = string_block.find(b"\x00", off)
-        if end == -1:
-            return ""
-        return string_block[off:end].decode("utf-8", "ignore").strip()
-
-    # Choose a name field index if not provided
-    if name_field_index is None:
-        cands = candidate_name_fields or [
-            1, 2, 3, 4, 5, 6, 7, 8,
-            10, 11, 12, 13, 14,
-            20, 21, 22, 23, 24, 25, 26, 27, 28,
-        ]
-        best_idx = None
-        best_score = -1
-        scan_n = min(rec_count, max_rows_scan)
-
-        for idx in cands:
-            score = 0
-            for i in range(scan_n):
-                roff = records_off + i * rec_size
-                fields = struct.unpack_from("<" + "I" * ints_per_record, data, roff)
-                if idx >= len(fields):
-                    continue
-                s = read_cstr(int(fields[idx]))
-                if s and any(ch.isalpha() for ch in s):
-                    score += 1
-            if score > best_score:
-                best_score = score
-                best_idx = idx
-
-        name_field_index = best_idx if best_idx is not None else 1
-
-    out: list[tuple[int, str]] = []
-    for i in range(rec_count):
-        roff = records_off + i * rec_size
-        fields = struct.unpack_from("<" + "I" * ints_per_record, data, roff)
-        rid = int(fields[0]) if fields else 0
-        noff = int(fields[name_field_index]) if len(fields) > name_field_index else 0
-        name = read_cstr(noff) if noff else ""
-        if rid:
-            out.append((rid, name or f"ID {rid}"))
-
-    out.sort(key=lambda t: (t[1] or "").lower())
-    return out
+        s = cstr_cache.get(off)
+        if s is not None:
+            return s
+        s = ""
+        if 0 < off < block_len:
+            end = string_text.find("\x00", off)
+            if end != -1:
+                s = string_text[off:end]
+                if not s.isascii():
+                    # non-ASCII names are UTF-8 on disk
+                    s = s.encode("latin-1").decode("utf-8", "ignore")
+                s = s.strip()
+        cstr_cache[off] = s
+        return s
+
+    arr = None
+    try:
+        if np is not None:
+            # (rec_count, ints_per_record) view; strides cope with rec_size % 4 != 0
+            arr = np.ndarray(
+                (rec_count, ints_per_record),
+                dtype="<u4",
+                buffer=data,
+                offset=records_off,
+                strides=(rec_size, 4),
+            )
+
+        # Choose a name field index if not provided
+        if name_field_index is None:
+            cands = candidate_name_fields or [
+                1, 2, 3, 4, 5, 6, 7, 8,
+                10, 11, 12, 13, 14,
+                20, 21, 22, 23, 24, 25, 26, 27, 28,
+            ]
+            scan_n = min(rec_count, max_rows_scan)
+            scores = [0] * len(cands)
+            valid = [j for j, idx in enumerate(cands) if idx < ints_per_record]
+
+            if arr is not None and valid:
+                # (scan_n, len(valid)) offset matrix: resolve every distinct offset
+                # once, then count name-like hits per column in one reduction
+                cand_arr = arr[:scan_n, [cands[j] for j in valid]]
+                offs, inverse = np.unique(cand_arr, return_inverse=True)
+                has_alpha = np.fromiter(
+                    (_ALPHA_RE(read_cstr(off)) is not None for off in offs.tolist()),
+                    dtype=bool,
+                    count=len(offs),
+                )
+                col_scores = has_alpha[inverse.reshape(cand_arr.shape)].sum(axis=0).tolist()
+                for j, score in zip(valid, col_scores):
+                    scores[j] = score
+            elif valid:
+                # shared offsets (e.g. empty locale columns) are judged once across
+                # all rows and candidates
+                resolved: Dict[int, bool] = {}
+                for i in range(scan_n):
+                    roff = records_off + i * rec_size
+                    fields = unpack_rec(data, roff)
+                    for j in valid:
+                        off = fields[cands[j]]
+                        alpha = resolved.get(off)
+                        if alpha is None:
+                            alpha = resolved[off] = _ALPHA_RE(read_cstr(off)) is not None
+                        scores[j] += alpha
+                    # drop candidates that can no longer win, even with every
+                    # remaining row a hit (ties go to the earlier candidate)
+                    remaining = scan_n - i - 1
+                    lead = max(valid, key=lambda j: (scores[j], -j))
+                    valid = [
+                        j for j in valid
+                        if scores[j] + remaining > scores[lead]
+                        or (j <= lead and scores[j] + remaining == scores[lead])
+                    ]
+                    if len(valid) == 1 and scores[lead]:
+                        break
+
+            # first candidate with the highest score wins
+            best_idx = cands[scores.index(max(scores))] if cands else None
+            name_field_index = best_idx if best_idx is not None else 1
+
+        if arr is not None:
+            # drop rid == 0 rows in C before any per-row Python work
+            live = arr[arr[:, 0] != 0]
+            ids = live[:, 0].tolist()
+            if name_field_index < ints_per_record:
+                pairs = zip(ids, live[:, name_field_index].tolist())
+            else:
+                pairs = ((rid, 0) for rid in ids)
+        else:
+            def _iter_pairs():
+                for i in range(rec_count):
+                    roff = records_off + i * rec_size
+                    fields = unpack_rec(data, roff)
+                    noff = fields[name_field_index] if len(fields) > name_field_index else 0
+                    yield fields[0], noff
+            pairs = _iter_pairs()
+
+        # decorate with the sort key while emitting; plain tuple sort, no key callback
+        keyed: list[tuple[str, int, str]] = []
+        for rid, noff in pairs:
+            if rid:
+                name = (read_cstr(noff) if noff else "") or f"ID {rid}"
+                keyed.append((name.lower(), rid, name))
+
+        keyed.sort()
+        return tuple((rid, name) for _key, rid, name in keyed)
+    finally:
+        arr = None  # drop the view before the caller closes the map
 
 class LootIDPickerDialog(QtWidgets.QDialog):
     """Type-as-you-type picker used by QuestLootEditor (no cross-imports).
@@ -101,6 +245,7 @@ class LootIDPickerDialog(QtWidgets.QDialog):
         self.db = db
         self.mode = mode
         self._selected_id: Optional[int] = None
+        self._req_id = 0
 
         self.setWindowTitle(f"Pick {mode.title()} ID")
         self.setModal(True)
@@ -143,7 +288,7 @@ class LootIDPickerDialog(QtWidgets.QDialog):
         self.btn_select.clicked.connect(self.accept_selected)
         self.table.cellDoubleClicked.connect(lambda _r, _c: self.accept_selected())
         self.q.returnPressed.connect(self.run_search)
-        self.q.textChanged.connect(lambda _t: self._live_timer.start(120))
+        self.q.textChanged.connect(lambda _t: self._live_timer.start(200))
 
         self.run_search()
 
@@ -162,32 +307,65 @@ class LootIDPickerDialog(QtWidgets.QDialog):
         raise ValueError(f"Unknown mode: {self.mode}")
 
     def run_search(self) -> None:
+        self._live_timer.stop()
         q = (self.q.text() or "").strip()
         tbl, idcol, namecol = self._table_and_cols()
         like = f"%{q}%"
 
-        try:
-            if q.isdigit():
-                rows = self.db.fetch_all(
-                    f"SELECT {idcol} AS id, {namecol} AS name FROM {tbl} WHERE {idcol}=%s LIMIT 200",
-                    (int(q),),
-                )
-            else:
-                rows = self.db.fetch_all(
-                    f"SELECT {idcol} AS id, {namecol} AS name FROM {tbl} WHERE {namecol} LIKE %s ORDER BY {idcol} LIMIT 200",
-                    (like,),
-                )
-        except Exception:
-            rows = []
+        if q.isdigit():
+            sql = f"SELECT {idcol} AS id, {namecol} AS name FROM {tbl} WHERE {idcol}=%s LIMIT 200"
+            fn: Callable[[], List[Dict[str, Any]]] = functools.partial(self.db.fetch_all, sql, (int(q),))
+        elif len(q) >= 2 and "%" not in q and "_" not in q:
+            fn = functools.partial(self._search_prefix_first, tbl, idcol, namecol, q)
+        else:
+            sql = f"SELECT {idcol} AS id, {namecol} AS name FROM {tbl} WHERE {namecol} LIKE %s ORDER BY {idcol} LIMIT 200"
+            fn = functools.partial(self.db.fetch_all, sql, (like,))
 
-        self.table.setRowCount(0)
-        for r in rows:
-            rid = int(r.get("id") or 0)
-            nm = str(r.get("name") or "").strip()
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(rid)))
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(nm))
+        # only the newest search may fill the table; older results are dropped
+        self._req_id += 1
+        req_id = self._req_id
+
+        def done(rows) -> None:
+            if req_id == self._req_id:
+                self._fill_rows(rows)
+
+        def failed(_e: Exception) -> None:
+            if req_id == self._req_id:
+                self._fill_rows([])
+
+        self.db.submit(fn, on_done=done, on_error=failed)
+
+    def _search_prefix_first(self, tbl: str, idcol: str, namecol: str, q: str, limit: int = 200) -> List[Dict[str, Any]]:
+        """
+        Names starting with q first (a leftmost-prefix LIKE can use an index on
+        the name column), then, only if that leaves room, names containing q.
+        """
+        rows = self.db.fetch_all(
+            f"SELECT {idcol} AS id, {namecol} AS name FROM {tbl} WHERE {namecol} LIKE %s ORDER BY {namecol} LIMIT {int(limit)}",
+            (f"{q}%",),
+        )
+        if len(rows) < limit:
+            rows += self.db.fetch_all(
+                f"SELECT {idcol} AS id, {namecol} AS name FROM {tbl} "
+                f"WHERE {namecol} LIKE %s AND {namecol} NOT LIKE %s ORDER BY {idcol} LIMIT {int(limit - len(rows))}",
+                (f"%{q}%", f"{q}%"),
+            )
+        return rows
+
+    def _fill_rows(self, rows) -> None:
+        # size once, then fill the preallocated rows without repainting per item
+        table = self.table
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(0)
+            table.setRowCount(len(rows))
+            for row, r in enumerate(rows):
+                rid = int(r.get("id") or 0)
+                nm = str(r.get("name") or "").strip()
+                table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(rid)))
+                table.setItem(row, 1, QtWidgets.QTableWidgetItem(nm))
+        finally:
+            table.setUpdatesEnabled(True)
 
     def accept_selected(self) -> None:
         sel = self.table.selectionModel().selectedRows()
@@ -203,6 +381,82 @@ class LootIDPickerDialog(QtWidgets.QDialog):
             return
         self.accept()
 
+class DbcRowsModel(QtCore.QAbstractTableModel):
+    """
+    [(id, name), ...] rows for DBCIdPickerDialog.
+    Filtering swaps the list of visible row indices; the view only asks
+    data() for the cells it paints, so no per-row items are built.
+    """
+    HEADERS = ["ID", "Name"]
+    BLOB_MIN_ROWS = 20000  # above this, filter with str.find over one joined string
+
+    def __init__(self, rows: List[Tuple[int, str]], parent=None):
+        super().__init__(parent)
+        self._rows = rows
+        self._visible: Sequence[int] = range(len(rows))  # unfiltered: no list at all
+        self._query = ""
+        # normalized once here, not on every keystroke
+        self._search_keys = [(str(i), (n or "").lower()) for i, n in rows]
+        self._blob = ""
+        self._row_starts: List[int] = []
+        if len(rows) > self.BLOB_MIN_ROWS:
+            # "name\x01id\n" per row; typed text can't contain either separator
+            parts = [f"{lo}\x01{si}\n" for si, lo in self._search_keys]
+            self._row_starts = list(itertools.accumulate(map(len, parts), initial=0))
+            self._blob = "".join(parts)
+
+    def set_filter(self, q: str) -> None:
+        q = q.strip().lower()
+        if q == self._query:
+            return  # e.g. only surrounding whitespace changed
+        self._query = q
+        self.beginResetModel()
+        if not q:
+            self._visible = range(len(self._rows))
+        elif self._blob:
+            self._visible = self._blob_matches(q)
+        else:
+            self._visible = [
+                k for k, (si, lo) in enumerate(self._search_keys)
+                if q in lo or q in si
+            ]
+        self.endResetModel()
+
+    def _blob_matches(self, q: str) -> List[int]:
+        """Row indices whose name or id contains q, in row order, via C-level find()."""
+        blob, starts = self._blob, self._row_starts
+        find = blob.find
+        out: List[int] = []
+        pos = find(q)
+        while pos != -1:
+            k = bisect.bisect_right(starts, pos) - 1
+            out.append(k)
+            pos = find(q, starts[k + 1])  # one hit per row is enough
+        return out
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._visible)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        i, n = self._rows[self._visible[index.row()]]
+        return str(i) if index.column() == 0 else (n or "")
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def id_at(self, row: int) -> Optional[int]:
+        if 0 <= row < len(self._visible):
+            return int(self._rows[self._visible[row]][0])
+        return None
+
+
 class DBCIdPickerDialog(QtWidgets.QDialog):
     """
     Search-as-you-type picker for DBC-derived rows: [(id, name), ...]
@@ -216,8 +470,9 @@ class DBCIdPickerDialog(QtWidgets.QDialog):
         self.search = QtWidgets.QLineEdit()
         self.search.setPlaceholderText("Type to filter…")
 
-        self.table = QtWidgets.QTableWidget(0, 2)
-        self.table.setHorizontalHeaderLabels(["ID", "Name"])
+        self.model = DbcRowsModel(rows, self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
@@ -239,7 +494,7 @@ class DBCIdPickerDialog(QtWidgets.QDialog):
         lay.addLayout(bb)
 
         self.search.textChanged.connect(self._refill)
-        self.table.cellDoubleClicked.connect(lambda _r, _c: self._accept_selected())
+        self.table.doubleClicked.connect(lambda _idx: self._accept_selected())
 
         if initial_query:
             self.search.setText(initial_query)
@@ -250,37 +505,243 @@ class DBCIdPickerDialog(QtWidgets.QDialog):
         return self._chosen
 
     def _refill(self) -> None:
-        q = (self.search.text() or "").strip().lower()
-        if not q:
-            rows = self._rows
-        else:
-            rows = [(i, n) for (i, n) in self._rows if q in str(i) or q in (n or "").lower()]
-
-        self.table.setRowCount(0)
-        for i, n in rows[:2000]:
-            r = self.table.rowCount()
-            self.table.insertRow(r)
-            self.table.setItem(r, 0, QtWidgets.QTableWidgetItem(str(i)))
-            self.table.setItem(r, 1, QtWidgets.QTableWidgetItem(n or ""))
-
-        if self.table.rowCount():
+        self.model.set_filter(self.search.text() or "")
+        if self.model.rowCount():
             self.table.selectRow(0)
 
     def _accept_selected(self) -> None:
-        r = self.table.currentRow()
-        if r < 0:
+        idx = self.table.currentIndex()
+        if not idx.isValid():
             return
-        item = self.table.item(r, 0)
-        if not item:
-            return
-        try:
-            self._chosen = int(item.text())
-        except Exception:
-            self._chosen = None
+        self._chosen = self.model.id_at(idx.row())
         if self._chosen is None:
             return
         self.accept()
 
+
+_READONLY_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+_EDITABLE_FLAGS = _READONLY_FLAGS | Qt.ItemFlag.ItemIsEditable
+
+
+class CondModel(QtCore.QAbstractTableModel):
+    """Conditions rows for QuestLootEditor, held as a list of dicts.
+
+    DB columns are editable; the trailing display columns are read-only.
+    Dropdown columns keep their int under EditRole and show "<id> - <name>".
+    Rows are handed to the view in chunks as it scrolls (canFetchMore/fetchMore).
+    """
+
+    TEXT_COLS = {"ScriptName", "Comment"}
+    CHUNK = 100
+
+    # row, column name -- only for edits made through the view (setData)
+    valueEdited = QtCore.pyqtSignal(int, str)
+
+    def __init__(
+        self,
+        cols: List[str],
+        display_cols: List[str],
+        choices: Dict[str, Dict[int, str]],
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._cols = list(cols)
+        self._headers = self._cols + list(display_cols)
+        self._col_idx = {c: i for i, c in enumerate(self._headers)}
+        self._editable = set(self._cols)
+        # flags() is hit for every painted cell; answer from a per-column table
+        self._col_flags = [_EDITABLE_FLAGS if c in self._editable else _READONLY_FLAGS for c in self._headers]
+        self._choice_names = dict(choices)  # column -> {id: name}, shared, not copied
+        self._rows: List[Dict[str, Any]] = []
+        self._loaded = 0  # rows[:_loaded] are visible to the view
+        self.tooltip_fn: Optional[Callable[[int, str], Optional[str]]] = None
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        col = self._headers[index.column()]
+        v = self._rows[index.row()].get(col)
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            names = self._choice_names.get(col)
+            if names is not None:
+                cur = int(v or 0)
+                name = names.get(cur) or ("Reference" if cur < 0 else "Unknown")
+                return f"{cur} - {name}"
+            return "" if v is None else str(v)
+
+        if role == Qt.ItemDataRole.EditRole:
+            if col in self._choice_names:
+                return int(v or 0)
+            # Text (not int) so the default delegate uses a line edit, not a
+            # spin box clamped to signed 32-bit.
+            return "" if v is None else str(v)
+
+        if role == Qt.ItemDataRole.ToolTipRole and self.tooltip_fn is not None:
+            return self.tooltip_fn(index.row(), col)
+
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+        col = self._headers[index.column()]
+        if col not in self._editable:
+            return False
+
+        if col in self.TEXT_COLS:
+            v: Any = "" if value is None else str(value)
+        else:
+            try:
+                v = int(str(value if value is not None else "").strip() or "0")
+            except ValueError:
+                return False
+
+        row = index.row()
+        if self._rows[row].get(col) == v:
+            return True
+        self._rows[row][col] = v
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        self.valueEdited.emit(row, col)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return self._col_flags[index.column()]
+
+    # ---- editor-side helpers (no valueEdited) ----
+    def row(self, row: int) -> Dict[str, Any]:
+        return self._rows[row]
+
+    def value(self, row: int, col: str) -> Any:
+        return self._rows[row].get(col)
+
+    def set_value(self, row: int, col: str, value: Any) -> None:
+        self._rows[row][col] = value
+        idx = self.index(row, self._col_idx[col])
+        self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+
+    def append_row(self, r: Dict[str, Any]) -> int:
+        # New rows go at the end: page the rest in first so the index is real
+        self.fetch_all_rows()
+        row = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._rows.append(r)
+        self._loaded += 1
+        self.endInsertRows()
+        return row
+
+    def set_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._loaded = min(len(self._rows), self.CHUNK)
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        n = min(self.CHUNK, len(self._rows) - self._loaded)
+        if n <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self._loaded, self._loaded + n - 1)
+        self._loaded += n
+        self.endInsertRows()
+
+    def fetch_all_rows(self) -> None:
+        while self.canFetchMore():
+            self.fetchMore()
+
+    def clear(self) -> None:
+        self.set_rows([])
+
+    def update_row(self, row: int, values: Dict[str, Any]) -> None:
+        self._rows[row].update(values)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._headers) - 1))
+
+    def refresh_row(self, row: int) -> None:
+        """Tell views the row's tooltips may have changed."""
+        if 0 <= row < self._loaded:
+            self.dataChanged.emit(
+                self.index(row, 0),
+                self.index(row, len(self._headers) - 1),
+                [Qt.ItemDataRole.ToolTipRole],
+            )
+
+
+class ChoiceComboDelegate(QtWidgets.QStyledItemDelegate):
+    """Edits an int column of CondModel through a QComboBox.
+
+    `build_combo(cur)` returns the populated combo; the pick is committed as
+    soon as the user selects an entry.
+    """
+
+    def __init__(self, build_combo: Callable[[int], QtWidgets.QComboBox], parent=None):
+        super().__init__(parent)
+        self._build_combo = build_combo
+
+    def createEditor(self, parent, option, index):
+        cb = self._build_combo(int(index.data(Qt.ItemDataRole.EditRole) or 0))
+        cb.setParent(parent)
+        cb.activated.connect(functools.partial(self._commit_and_close, cb))
+        QTimer.singleShot(0, cb.showPopup)
+        return cb
+
+    def setEditorData(self, editor, index) -> None:
+        i = editor.findData(int(index.data(Qt.ItemDataRole.EditRole) or 0))
+        if i >= 0:
+            editor.setCurrentIndex(i)
+
+    def setModelData(self, editor, model, index) -> None:
+        model.setData(index, editor.currentData(), Qt.ItemDataRole.EditRole)
+
+    def _commit_and_close(self, cb: QtWidgets.QComboBox, _index: int = -1) -> None:
+        self.commitData.emit(cb)
+        self.closeEditor.emit(cb)
+
+
+# Per-column value decoders for QuestLootEditor._cond_row_dict
+def _decode_int(v: Any) -> int:
+    if type(v) is int:
+        return v
+    txt = "" if v is None else str(v).strip()
+    return int(txt) if txt != "" else 0
+
+
+def _decode_script(v: Any) -> str:
+    return "" if v is None else str(v).strip()
+
+
+def _decode_comment(v: Any) -> Optional[str]:
+    return _decode_script(v) or None
+
+
+def _cond_upsert_sql(cols: List[str], pk: List[str]) -> str:
+    """INSERT ... ON DUPLICATE KEY UPDATE for the conditions table (non-PK columns updated)."""
+    pk_set = set(pk)
+    return (
+        "INSERT INTO conditions (" + ",".join(f"`{c}`" for c in cols) + ") "
+        "VALUES (" + ",".join(["%s"] * len(cols)) + ") "
+        "ON DUPLICATE KEY UPDATE " + ",".join(f"`{c}`=VALUES(`{c}`)" for c in cols if c not in pk_set)
+    )
+
+
 class QuestLootEditor(QtWidgets.QWidget):
     """
     A combined editor for:
@@ -316,6 +777,17 @@ class QuestLootEditor(QtWidgets.QWidget):
         "Comment",
     ]
         
+    # (column, decoder) pairs for _cond_row_dict, resolved once instead of per column per call
+    _COND_DECODERS = tuple(
+        (c, _decode_comment if c == "Comment" else _decode_script if c == "ScriptName" else _decode_int)
+        for c in COND_COLS
+    )
+
+    # Column name -> index (avoids COND_COLS.index() scans in the edit handlers)
+    COND_COL_IDX = {c: i for i, c in enumerate(COND_COLS)}
+    COND_SRC_TYPE_IDX = COND_COL_IDX["SourceTypeOrReferenceId"]
+    COND_TYPE_IDX = COND_COL_IDX["ConditionTypeOrReference"]
+
     # Display-only columns (NOT stored in DB)
     COND_DISPLAY_COLS = [
         "SourceGroupName",  # creature_template.name OR gameobject_template.name
@@ -337,20 +809,97 @@ class QuestLootEditor(QtWidgets.QWidget):
         "NegativeCondition",
     ]
 
+    # Columns whose double-click opens an ID picker (see _on_cond_cell_double_clicked)
+    COND_PICKER_COLS = ("SourceGroup", "SourceEntry", "ConditionValue1")
+
     # Generic loot-template columns (shared by *_loot_template tables)
-    LOOT_COLS = [
-        "entry",
-        "item",
-        "ChanceOrQuestChance",
-        "lootmode",
-        "groupid",
-        "mincountOrRef",
-        "maxcount",
-    ]
+    LOOT_COLS = GenericLootEditor.LOOT_COLS
 
     # These types typically want ConditionValue1 = quest_id
     QUEST_TYPES_NEED_QUEST_ID = {8, 9, 14, 28, 43, 47}
     ANCHOR_COND_TYPE = 9
+
+    # Condition types whose CV1/2/3 = quest_id anchor a condition group to the quest
+    COND_QUEST_TYPES = (8, 9, 14, 28, 43, 47)
+
+    # ---- SQL built once from the column lists above ----
+    _UPSERT_SQL = _cond_upsert_sql(COND_COLS, COND_PK)
+    _SQL_DELETE_COND_ONE = "DELETE FROM conditions WHERE " + " AND ".join(f"`{k}`=%s" for k in COND_PK)
+    # Followed by "(%s,...),(%s,...)" per row and a closing ")"
+    _SQL_DELETE_COND_MANY_HEAD = (
+        "DELETE FROM conditions WHERE (" + ",".join(f"`{k}`" for k in COND_PK) + ") IN ("
+    )
+
+    # sync_from_required_items in one statement: discover quest-drop (entry,item) pairs
+    # in creature_loot_template, skip pairs the quest already anchors, and insert the
+    # rest with SourceIds allocated server-side (MAX over the quest's anchors, then
+    # @qe_sid + 1 per inserted row). The item IN list is filled in per call.
+    # Params: (ANCHOR_COND_TYPE, quest_id, *COND_QUEST_TYPES, qid, qid, qid,
+    #          *items, *COND_QUEST_TYPES, qid, qid, qid)
+    _SQL_SYNC_ANCHORS = f"""
+        INSERT INTO conditions (
+            SourceTypeOrReferenceId, SourceGroup, SourceEntry, SourceId, ElseGroup,
+            ConditionTypeOrReference, ConditionTarget,
+            ConditionValue1, ConditionValue2, ConditionValue3,
+            NegativeCondition, ErrorTextId, ScriptName, Comment
+        )
+        SELECT 1, clt.entry, clt.item, (@qe_sid := @qe_sid + 1), 0, %s, 0, %s, 0, 0, 0, 0, '', ''
+        FROM (
+          SELECT @qe_sid := (
+            SELECT COALESCE(MAX(SourceId), 0)
+            FROM conditions
+            WHERE ConditionTypeOrReference IN ({",".join(["%s"] * len(COND_QUEST_TYPES))})
+              AND (
+                    ConditionValue1 = %s
+                 OR ConditionValue2 = %s
+                 OR ConditionValue3 = %s
+              )
+          )
+        ) init
+        CROSS JOIN (
+          SELECT DISTINCT entry, item
+          FROM creature_loot_template
+          WHERE item IN ({{items}})
+            AND ChanceOrQuestChance < 0
+          ORDER BY entry, item
+        ) clt
+        WHERE NOT EXISTS (
+          SELECT 1
+          FROM conditions c
+          WHERE c.ConditionTypeOrReference IN ({",".join(["%s"] * len(COND_QUEST_TYPES))})
+            AND (
+                  c.ConditionValue1 = %s
+               OR c.ConditionValue2 = %s
+               OR c.ConditionValue3 = %s
+            )
+            AND c.SourceTypeOrReferenceId = 1
+            AND c.SourceGroup = clt.entry
+            AND c.SourceEntry = clt.item
+        )
+        """
+
+    # ALL condition rows for the anchor keys (class/race/level/etc included) in one
+    # round trip: the anchor keys are a derived table joined back to conditions.
+    # Display names are resolved client-side (see _lookup_condition_names).
+    _SQL_LOAD_CONDITIONS = f"""
+        SELECT {"c." + ",c.".join(COND_COLS)}
+        FROM conditions c
+        JOIN (
+          SELECT DISTINCT
+            SourceTypeOrReferenceId, SourceGroup, SourceEntry, SourceId
+          FROM conditions
+          WHERE ConditionTypeOrReference IN ({",".join(["%s"] * len(COND_QUEST_TYPES))})
+            AND (
+                  ConditionValue1 = %s
+               OR ConditionValue2 = %s
+               OR ConditionValue3 = %s
+            )
+        ) k ON k.SourceTypeOrReferenceId = c.SourceTypeOrReferenceId
+           AND k.SourceGroup = c.SourceGroup
+           AND k.SourceEntry = c.SourceEntry
+           AND k.SourceId = c.SourceId
+        ORDER BY c.SourceGroup, c.SourceEntry, c.SourceId, c.ElseGroup, c.ConditionTypeOrReference
+        """
     
     # ConditionTypeOrReference dropdown (leave out deprecated)
     COND_TYPE_CHOICES = [
@@ -413,6 +962,8 @@ class QuestLootEditor(QtWidgets.QWidget):
         (58, "STRING_ID"),
         (59, "LABEL"),
     ]
+    # id -> name, built once; the list above keeps the dropdown order
+    COND_TYPE_NAME: Dict[int, str] = dict(COND_TYPE_CHOICES)
 
     COND_TOOLTIP_HEADER = (
         "ConditionTypeOrReference:\n"
@@ -557,6 +1108,7 @@ class QuestLootEditor(QtWidgets.QWidget):
         (35, "SKILL_LINE_ABILITY"),
         (36, "PLAYER_CHOICE_RESPONSE"),
     ]
+    SRC_TYPE_NAME: Dict[int, str] = dict(SRC_TYPE_CHOICES)
 
     SRC_TOOLTIP_HEADER = (
         "SourceTypeOrReferenceId:\n"
@@ -919,20 +1471,69 @@ class QuestLootEditor(QtWidgets.QWidget):
         self.log = log
         self.quest_id: Optional[int] = None
         self._is_loading: bool = False  # suppress auto-populate while loading from DB
+        self._cond_seq = 0   # bumps per _load_conditions; stale results are dropped
+        # entry -> name caches for the display columns ("" = looked up, no such row)
+        self._creature_names: Dict[int, str] = {}
+        self._go_names: Dict[int, str] = {}
+        self._item_names: Dict[int, str] = {}
+        self._db_jobs = 0    # in-flight background DB jobs (buttons disabled while > 0)
 
         # --- Conditions table ---
-        headers = self.COND_COLS + self.COND_DISPLAY_COLS
-        self.cond_table = QtWidgets.QTableWidget(0, len(headers))
-        self.cond_table.setHorizontalHeaderLabels(headers)
-        # Make display columns read-only visually (still a normal table item, just disabled editing)
+        self.cond_model = CondModel(
+            self.COND_COLS,
+            self.COND_DISPLAY_COLS,
+            {
+                "SourceTypeOrReferenceId": self.SRC_TYPE_NAME,
+                "ConditionTypeOrReference": self.COND_TYPE_NAME,
+            },
+            self,
+        )
+        self.cond_model.tooltip_fn = self._condition_tooltip
+        self.cond_model.valueEdited.connect(self._on_cond_value_edited)
+
+        self.cond_table = QtWidgets.QTableView()
+        self.cond_table.setModel(self.cond_model)
+        # Display columns are read-only via CondModel.flags()
         self._display_col_start = len(self.COND_COLS)
 
+        # Dropdown columns edit through a combo delegate (one editor at a time,
+        # instead of a QComboBox cell widget per row).
+        # The choice lists live in one shared item model each; editors only point at it.
+        self._cond_delegates = []
+        for col_idx, choices in (
+            (self.COND_SRC_TYPE_IDX, self.SRC_TYPE_CHOICES),
+            (self.COND_TYPE_IDX, self.COND_TYPE_CHOICES),
+        ):
+            shared = self._make_choice_model(choices)
+            dlg = ChoiceComboDelegate(
+                lambda cur, choices=choices, shared=shared: self._shared_choice_combo(shared, choices, cur),
+                self.cond_table,
+            )
+            self.cond_table.setItemDelegateForColumn(col_idx, dlg)
+            self._cond_delegates.append(dlg)
+
+        # Double-click is reserved for the ID pickers (see _on_cond_view_double_clicked)
+        trig = QtWidgets.QAbstractItemView.EditTrigger
+        self.cond_table.setEditTriggers(trig.SelectedClicked | trig.EditKeyPressed | trig.AnyKeyPressed)
 
         self.cond_table.horizontalHeader().setStretchLastSection(True)
+        # Fixed row height: Qt doesn't have to measure every row on reload
+        vh = self.cond_table.verticalHeader()
+        vh.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        vh.setDefaultSectionSize(self.cond_table.fontMetrics().height() + 8)
         self.cond_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
-        self.cond_table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
-        self.cond_table.itemSelectionChanged.connect(self._on_condition_selected)
-        self.cond_table.cellDoubleClicked.connect(self._on_cond_cell_double_clicked)
+        self.cond_table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+        # (row, source type, loot key) of the current row; dropped on any selection/model change.
+        # Connected before _on_condition_selected so that handler never sees a stale entry.
+        self._sel_cache: Optional[Tuple[int, int, Optional[Tuple[int, int]]]] = None
+        sel_model = self.cond_table.selectionModel()
+        sel_model.currentChanged.connect(self._drop_sel_cache)
+        sel_model.selectionChanged.connect(self._drop_sel_cache)
+        for sig in (self.cond_model.modelReset, self.cond_model.dataChanged,
+                    self.cond_model.rowsInserted, self.cond_model.rowsRemoved):
+            sig.connect(self._drop_sel_cache)
+        sel_model.selectionChanged.connect(lambda *_: self._on_condition_selected())
+        self.cond_table.doubleClicked.connect(self._on_cond_view_double_clicked)
 
 
         self.btn_cond_reload = QtWidgets.QPushButton("Reload")
@@ -966,14 +1567,36 @@ class QuestLootEditor(QtWidgets.QWidget):
         self._tab_for_source = {}
         self._editor_for_source = {}
 
+        # Loot saves from every tab are staged here and committed together
+        self.loot_txn = TxnBuffer(self.db, parent=self)
+        self.loot_txn.pendingChanged.connect(self._on_loot_pending_changed)
+        self.loot_txn.flushed.connect(lambda n: self.log(f"Saved {n} pending loot row(s)."))
+        self.loot_txn.flushFailed.connect(self._on_loot_flush_failed)
+
         for st, (label, table) in sorted(self.LOOT_TABS.items()):
-            ed = GenericLootEditor(self.db, self.log, table)
+            ed = GenericLootEditor(self.db, self.log, table, txn=self.loot_txn)
             idx = self.right_tabs.addTab(ed, label)
             self._tab_for_source[st] = idx
             self._editor_for_source[st] = ed
 
+        self.btn_loot_save_all = QtWidgets.QPushButton("Save All Loot")
+        self.btn_loot_save_all.setEnabled(False)
+        self.btn_loot_save_all.clicked.connect(self.loot_txn.flush)
+
+        loot_btns = QtWidgets.QHBoxLayout()
+        loot_btns.addStretch(1)
+        loot_btns.addWidget(self.btn_loot_save_all)
+
+        loot_box = QtWidgets.QVBoxLayout()
+        loot_box.setContentsMargins(0, 0, 0, 0)
+        loot_box.addWidget(self.right_tabs, 1)
+        loot_box.addLayout(loot_btns)
+
+        loot_widget = QtWidgets.QWidget()
+        loot_widget.setLayout(loot_box)
+
         split.addWidget(cond_widget)
-        split.addWidget(self.right_tabs)
+        split.addWidget(loot_widget)
 
         # Give conditions MOST of the space
         split.setStretchFactor(0, 4)
@@ -999,6 +1622,8 @@ class QuestLootEditor(QtWidgets.QWidget):
     # Public API used by app.py
     # -------------------------
     def load(self, quest_id: int) -> None:
+        # Don't carry staged loot edits over to another quest unsaved
+        self.loot_txn.flush()
         self.quest_id = quest_id
         self._load_conditions()
         self.clear_loot_form()
@@ -1009,6 +1634,20 @@ class QuestLootEditor(QtWidgets.QWidget):
             self._load_conditions()
             self.clear_loot_form()
     
+    def _on_loot_pending_changed(self, n: int) -> None:
+        self.btn_loot_save_all.setEnabled(n > 0)
+        self.btn_loot_save_all.setText(f"Save All Loot ({n})" if n else "Save All Loot")
+        dirty = {key[0] for key in self.loot_txn.pending_keys()}
+        for st, (label, table) in self.LOOT_TABS.items():
+            self.right_tabs.setTabText(self._tab_for_source[st], label + (" *" if table in dirty else ""))
+
+    def _on_loot_flush_failed(self, e: Exception) -> None:
+        QtWidgets.QMessageBox.critical(
+            self, "Save failed",
+            f"{e}\n\nNothing was written; the pending loot rows are kept so you can retry.",
+        )
+        self.log(f"ERROR saving pending loot rows: {e}")
+
     def sync_from_required_items(self, item_ids: list[int]) -> None:
         """
         Ensure the Conditions list has rows for the quest's required items.
@@ -1017,181 +1656,90 @@ class QuestLootEditor(QtWidgets.QWidget):
           - If the item already exists in creature_loot_template as a quest drop
             (ChanceOrQuestChance < 0), create missing anchored condition rows for each
             (entry,item) pair.
-          - If no quest-drop loot rows exist for an item, create ONE placeholder condition
-            row with SourceGroup=0, SourceEntry=item so the user can fill SourceGroup later.
+          - Items with no quest-drop loot rows get nothing (no placeholder rows).
         """
         if self.quest_id is None:
             return
 
-        # Normalize + de-dupe
-        items = sorted({int(x) for x in item_ids if str(x).strip().isdigit() and int(x) > 0})
+        # De-dupe (QuestEditor._get_required_item_ids already hands over positive ints)
+        items = sorted({x for x in item_ids if isinstance(x, int) and x > 0})
         if not items:
             return
 
-        try:
-            # Existing anchored rows for this quest (keyed by SourceType/Group/Entry)
-            quest_types = (8, 9, 14, 28, 43, 47)
-            ph = ",".join(["%s"] * len(quest_types))
-
-            existing = self.db.fetch_all(
-                f"""
-                SELECT SourceTypeOrReferenceId, SourceGroup, SourceEntry
-                FROM conditions
-                WHERE ConditionTypeOrReference IN ({ph})
-                  AND (
-                        ConditionValue1 = %s
-                     OR ConditionValue2 = %s
-                     OR ConditionValue3 = %s
-                  )
-                """,
-                (*quest_types, int(self.quest_id), int(self.quest_id), int(self.quest_id)),
-            )
-
-            have_pairs = {
-                (int(r["SourceTypeOrReferenceId"]), int(r["SourceGroup"]), int(r["SourceEntry"]))
-                for r in existing
-            }
-
-            row = self.db.fetch_one(
-                f"""
-                SELECT COALESCE(MAX(SourceId), 0) AS m
-                FROM conditions
-                WHERE ConditionTypeOrReference IN ({ph})
-                  AND (
-                        ConditionValue1 = %s
-                     OR ConditionValue2 = %s
-                     OR ConditionValue3 = %s
-                  )
-                """,
-                (*quest_types, int(self.quest_id), int(self.quest_id), int(self.quest_id)),
-            )
-            next_source_id = int(row["m"] or 0) + 1
-
-            # 1) Discover existing quest-drop sources in creature_loot_template
-            #    (ChanceOrQuestChance < 0 usually means quest-required drop)
-            placeholders_needed = set(items)
-            found_pairs: list[tuple[int, int]] = []
-
-            # Chunk to avoid huge IN lists
-            CHUNK = 50
-            for i in range(0, len(items), CHUNK):
-                chunk = items[i : i + CHUNK]
-                ph = ",".join(["%s"] * len(chunk))
-
-                rows = self.db.fetch_all(
-                    f"""
-                    SELECT DISTINCT entry, item
-                    FROM creature_loot_template
-                    WHERE item IN ({ph})
-                      AND ChanceOrQuestChance < 0
-                    """,
-                    tuple(chunk),
-                )
-                for r in rows:
-                    e = int(r["entry"])
-                    it = int(r["item"])
-                    found_pairs.append((e, it))
-                    if it in placeholders_needed:
-                        placeholders_needed.discard(it)
-
-
-            inserts: list[tuple] = []
-
-            # Insert missing discovered (entry,item) rows
-            for entry, item in found_pairs:
-                key = (1, int(entry), int(item))  # SourceType=1 creature loot
-                if key in have_pairs:
-                    continue
-
-                inserts.append(
-                    (
-                        1,                 # SourceTypeOrReferenceId (CreatureLoot)
-                        int(entry),         # SourceGroup
-                        int(item),          # SourceEntry
-                        next_source_id,     # SourceId (unique)
-                        0,                 # ElseGroup
-                        self.ANCHOR_COND_TYPE,  # ConditionTypeOrReference (Quest Active) anchor
-                        0,                 # ConditionTarget
-                        int(self.quest_id), # ConditionValue1
-                        0, 0,              # ConditionValue2/3
-                        0,                 # NegativeCondition
-                        0,                 # ErrorTextId
-                        "",                # ScriptName
-                        "",                # Comment
-                    )
-                )
-                next_source_id += 1
-
-            # 2) Add placeholder rows for items that had no quest-drop sources
-            #    Only if there isn't already ANY anchor row with SourceEntry=item
-            # DISABLED: never insert placeholder rows
-            placeholders_needed = set()
-            if False and placeholders_needed:
-                existing_entries = self.db.fetch_all(
-                    f"""
-                    SELECT DISTINCT SourceEntry
-                    FROM conditions
-                    WHERE ConditionTypeOrReference = %s
-                      AND ConditionValue1 = %s
-                      AND SourceTypeOrReferenceId = 1
-                      AND SourceEntry IN ({",".join(["%s"] * len(placeholders_needed))})
-                    """,
-                    (self.ANCHOR_COND_TYPE, self.quest_id, *sorted(placeholders_needed)),
-                )
-                have_sourceentry = {int(r["SourceEntry"]) for r in existing_entries}
-
-                for item in sorted(placeholders_needed):
-                    if item in have_sourceentry:
-                        continue
-
-                    inserts.append(
-                        (
-                            1,                 # SourceTypeOrReferenceId (CreatureLoot)
-                            0,                 # SourceGroup (unknown yet)
-                            int(item),          # SourceEntry
-                            next_source_id,     # SourceId (unique)
-                            0,                 # ElseGroup
-                            self.ANCHOR_COND_TYPE,   # ConditionTypeOrReference (Quest Active) anchor
-                            0,                 # ConditionTarget
-                            int(self.quest_id), # ConditionValue1
-                            0, 0,              # ConditionValue2/3
-                            0,                 # NegativeCondition
-                            0,                 # ErrorTextId
-                            "",                # ScriptName
-                            "AUTO: placeholder from ReqItemId",  # Comment
-                        )
-                    )
-                    next_source_id += 1
-
-            # Perform inserts if needed
-            if inserts:
-                self.db.executemany(
-                    """
-                    INSERT INTO conditions (
-                        SourceTypeOrReferenceId, SourceGroup, SourceEntry, SourceId, ElseGroup,
-                        ConditionTypeOrReference, ConditionTarget,
-                        ConditionValue1, ConditionValue2, ConditionValue3,
-                        NegativeCondition, ErrorTextId, ScriptName, Comment
-                    )
-                    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                    """,
-                    inserts,
-                )
-                self.db.commit()
-                self.log(f"Quest Loot: added {len(inserts)} condition row(s) from required items.")
-            else:
-                # nothing new
+        def done(n: int) -> None:
+            if not n:
                 return
-
+            self.log(f"Quest Loot: added {n} condition row(s) from required items.")
             # Refresh UI
             self._load_conditions()
 
-        except Exception as e:
+        self._run_db_job(
+            self._in_txn, self._sync_required_items_db, int(self.quest_id), items,
+            on_done=done,
+            on_error=lambda e: self.log(f"Quest Loot sync failed: {type(e).__name__}: {e}"),
+        )
+
+    def _sync_required_items_db(self, quest_id: int, items: list[int]) -> int:
+        """
+        Worker side of sync_from_required_items: discovery, de-dupe against the quest's
+        existing anchors and SourceId allocation all happen in one INSERT ... SELECT.
+        Returns the number of rows inserted.
+        """
+        # ReqItemId1..6, so the IN list stays small
+        sql = self._SQL_SYNC_ANCHORS.replace("{items}", ",".join(["%s"] * len(items)))
+        anchor = (*self.COND_QUEST_TYPES, quest_id, quest_id, quest_id)
+        n = self.db.execute(sql, (self.ANCHOR_COND_TYPE, quest_id, *anchor, *items, *anchor))
+        return max(n, 0)
+
+    # -------------------------
+    # Background DB jobs
+    # -------------------------
+    def _run_db_job(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_done: Callable[[Any], None],
+        on_error: Callable[[Exception], None],
+    ) -> None:
+        """
+        Run a DB call off the GUI thread (Database.submit). Callbacks run on the GUI
+        thread; the condition buttons stay disabled while any job is in flight.
+        fn must not touch widgets.
+        """
+        self._db_jobs += 1
+        self._set_cond_buttons_enabled(False)
+
+        def finish() -> None:
+            self._db_jobs -= 1
+            if self._db_jobs == 0:
+                self._set_cond_buttons_enabled(True)
+
+        def done(res: Any) -> None:
+            finish()
+            on_done(res)
+
+        def failed(e: Exception) -> None:
+            finish()
+            on_error(e)
+
+        self.db.submit(fn, *args, on_done=done, on_error=failed)
+
+    def _in_txn(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Worker side: fn(*args) then commit; rollback (same thread/connection) on error."""
+        try:
+            res = fn(*args)
+            self.db.commit()
+            return res
+        except Exception:
             try:
                 self.db.rollback()
             except Exception:
                 pass
-            self.log(f"Quest Loot sync failed: {type(e).__name__}: {e}")
+            raise
+
+    def _set_cond_buttons_enabled(self, on: bool) -> None:
+        for b in (self.btn_cond_reload, self.btn_cond_save, self.btn_cond_delete):
+            b.setEnabled(on)
     
     def _ensure_spell_rows(self) -> None:
         if self._spell_rows:
@@ -1277,6 +1825,14 @@ class QuestLootEditor(QtWidgets.QWidget):
         except Exception:
             pass
 
+    def _on_cond_view_double_clicked(self, index: QtCore.QModelIndex) -> None:
+        col_idx = index.column()
+        if col_idx < len(self.COND_COLS) and self.COND_COLS[col_idx] in self.COND_PICKER_COLS:
+            self._on_cond_cell_double_clicked(index.row(), col_idx)
+            return
+        # No picker for this column: keep double-click-to-edit
+        self.cond_table.edit(index)
+
     def _on_cond_cell_double_clicked(self, row, col_idx):
         if col_idx >= len(self.COND_COLS):
             return
@@ -1284,18 +1840,10 @@ class QuestLootEditor(QtWidgets.QWidget):
         col = self.COND_COLS[col_idx]
 
         def cur_int(col_name: str) -> int:
-            try:
-                it = self.cond_table.item(row, self.COND_COLS.index(col_name))
-                return int((it.text() or "0").strip()) if it else 0
-            except Exception:
-                return 0
+            return self._get_cell_int(row, col_name, 0)
 
         def setv(v: int) -> None:
-            it = self.cond_table.item(row, col_idx)
-            if it:
-                it.setText(str(int(v)))
-            else:
-                self.cond_table.setItem(row, col_idx, QtWidgets.QTableWidgetItem(str(int(v))))
+            self._set_cell_int(row, col, int(v))
             self._update_condition_display_cols(row)
 
         st = cur_int("SourceTypeOrReferenceId")
@@ -1421,105 +1969,157 @@ class QuestLootEditor(QtWidgets.QWidget):
     # -------------------------
     def _load_conditions(self) -> None:
         assert self.quest_id is not None
-        cols = "c." + ",c.".join(self.COND_COLS)
-
-        # 1) Find all condition "groups" (same source key) anchored by:
-        #    ConditionType=2 (Player has quest) and ConditionValue1 = quest_id
-        quest_types = (8, 9, 14, 28, 43, 47)
-        ph = ",".join(["%s"] * len(quest_types))
-
-        keys = self.db.fetch_all(
-            f"""
-            SELECT DISTINCT
-              SourceTypeOrReferenceId, SourceGroup, SourceEntry, SourceId
-            FROM conditions
-            WHERE ConditionTypeOrReference IN ({ph})
-              AND (
-                    ConditionValue1 = %s
-                 OR ConditionValue2 = %s
-                 OR ConditionValue3 = %s
-              )
-            """,
-            (*quest_types, int(self.quest_id), int(self.quest_id), int(self.quest_id)),
+        quest_id = int(self.quest_id)
+        self._cond_seq += 1
+        seq = self._cond_seq
+        self._run_db_job(
+            self._fetch_conditions, quest_id,
+            on_done=functools.partial(self._apply_conditions, seq, quest_id),
+            on_error=lambda e: self.log(f"ERROR loading conditions for quest {quest_id}: {e}"),
         )
 
-
-        # If there are no anchor rows, show nothing (correct) but log why
-        if not keys:
-            self.cond_table.setRowCount(0)
-            self.log(f"Loaded 0 condition row(s) for quest {self.quest_id} (no quest-related condition types found: {quest_types}).")
-            return
-
-        # 2) Load ALL condition rows for those keys (class/race/level/etc included)
-        # Build a tuple-IN: (a,b,c,d) IN ((...),(...)...)
-        placeholders = ",".join(["(%s,%s,%s,%s)"] * len(keys))
-        params = []
-        for k in keys:
-            params.extend([
-                int(k.get("SourceTypeOrReferenceId", 0)),
-                int(k.get("SourceGroup", 0)),
-                int(k.get("SourceEntry", 0)),
-                int(k.get("SourceId", 0)),
-            ])
-
+    def _fetch_conditions(
+        self, quest_id: int
+    ) -> Tuple[
+        List[Dict[str, Any]],
+        List[Tuple[GenericLootEditor, List[Tuple[int, int]], Dict]],
+        Dict[str, Dict[int, str]],
+    ]:
+        """Worker side of _load_conditions (DB only, no widgets)."""
+        # Condition "groups" (same source key) anchored by a quest-related
+        # ConditionType with CV1/2/3 = quest_id, plus every row in those groups
         rows = self.db.fetch_all(
-            f"""
-            SELECT
-              {cols},
-              COALESCE(ct.name, gt.name, '') AS SourceGroupName,
-              IFNULL(it.name, '')            AS ItemName
-            FROM conditions c
-            LEFT JOIN creature_template   ct ON ct.entry = c.SourceGroup
-            LEFT JOIN gameobject_template gt ON gt.entry = c.SourceGroup
-            LEFT JOIN item_template       it ON it.entry = c.SourceEntry
-            WHERE (c.SourceTypeOrReferenceId, c.SourceGroup, c.SourceEntry, c.SourceId) IN ({placeholders})
-            ORDER BY c.SourceGroup, c.SourceEntry, c.SourceId, c.ElseGroup, c.ConditionTypeOrReference
-            """,
-            tuple(params),
+            self._SQL_LOAD_CONDITIONS,
+            (*self.COND_QUEST_TYPES, quest_id, quest_id, quest_id),
         )
+        return rows, self._prefetch_loot_rows(rows), self._lookup_condition_names(rows)
 
-        self._is_loading = True
-        self.cond_table.setRowCount(0)
+    def _prefetch_loot_rows(
+        self, rows: List[Dict[str, Any]]
+    ) -> List[Tuple[GenericLootEditor, List[Tuple[int, int]], Dict]]:
+        """
+        Loot rows for every (SourceGroup, SourceEntry) in rows, one query per loot
+        table, so clicking through the conditions afterwards needs no SELECTs.
+        """
+        by_st: Dict[int, set] = {}
         for r in rows:
-            self._append_condition_row(r)
-        self._is_loading = False
+            st = int(r["SourceTypeOrReferenceId"] or 0)
+            sg = int(r["SourceGroup"] or 0)
+            se = int(r["SourceEntry"] or 0)
+            if st in self._editor_for_source and sg > 0 and se > 0:
+                by_st.setdefault(st, set()).add((sg, se))
+        out = []
+        for st, keys in by_st.items():
+            ed = self._editor_for_source[st]
+            keys_l = sorted(keys)
+            out.append((ed, keys_l, ed.fetch_rows(keys_l)))
+        return out
+
+    def _lookup_condition_names(self, rows: List[Dict[str, Any]]) -> Dict[str, Dict[int, str]]:
+        """
+        Worker side: names for the SourceGroup/SourceEntry ids of rows that are not in
+        the entry->name caches yet ("" = no such row). Only reads the caches; the
+        result is merged on the GUI thread by _apply_condition_names, so a reload
+        after save/delete is a single-table query.
+        """
+        groups = {int(r["SourceGroup"] or 0) for r in rows}
+        entries = {int(r["SourceEntry"] or 0) for r in rows}
+        out: Dict[str, Dict[int, str]] = {}
+        for table, cache, ids in (
+            ("creature_template", self._creature_names, groups),
+            ("gameobject_template", self._go_names, groups),
+            ("item_template", self._item_names, entries),
+        ):
+            missing = sorted(i for i in ids if i > 0 and i not in cache)
+            if not missing:
+                continue
+            found = self.db.fetch_all(
+                f"SELECT entry, name FROM {table} WHERE entry IN ({','.join(['%s'] * len(missing))})",
+                missing,
+            )
+            names = dict.fromkeys(missing, "")
+            for r in found:
+                names[int(r["entry"])] = r["name"] or ""
+            out[table] = names
+        return out
 
-        self.log(f"Loaded {len(rows)} condition row(s) for quest {self.quest_id} across {len(keys)} source group(s).")
-    
-    def _apply_src_tooltip_to_row(self, row_idx: int) -> None:
-        col = self.COND_COLS.index("SourceTypeOrReferenceId")
-        w = self.cond_table.cellWidget(row_idx, col)
-        if not isinstance(w, QtWidgets.QComboBox):
-            return
+    def _apply_condition_names(self, rows: List[Dict[str, Any]], names: Dict[str, Dict[int, str]]) -> None:
+        """
+        GUI side: merge _lookup_condition_names() results into the caches, then fill
+        SourceGroupName (creature, else gameobject) and ItemName.
+        """
+        for table, cache in (
+            ("creature_template", self._creature_names),
+            ("gameobject_template", self._go_names),
+            ("item_template", self._item_names),
+        ):
+            cache.update(names.get(table, ()))
 
-        st = int(w.currentData() or 0)
-        info = self.SRC_TOOLTIP_MAP.get(st)
+        for r in rows:
+            sg = int(r["SourceGroup"] or 0)
+            r["SourceGroupName"] = self._creature_names.get(sg) or self._go_names.get(sg) or ""
+            r["ItemName"] = self._item_names.get(int(r["SourceEntry"] or 0)) or ""
+
+    def _apply_conditions(
+        self,
+        seq: int,
+        quest_id: int,
+        result: Tuple[
+            List[Dict[str, Any]],
+            List[Tuple[GenericLootEditor, List[Tuple[int, int]], Dict]],
+            Dict[str, Dict[int, str]],
+        ],
+    ) -> None:
+        # A newer load (or another quest) superseded this result
+        if seq != self._cond_seq:
+            return
+
+        rows, loot, names = result
+        self._apply_condition_names(rows, names)
+        for ed, keys, found in loot:
+            ed.prime_cache(keys, found)
 
-        if not info:
-            tip = self.SRC_TOOLTIP_HEADER + f"\n\n(Unknown SourceTypeOrReferenceId: {st})"
-        else:
-            parts = [
-                self.SRC_TOOLTIP_HEADER,
-                "",
-                f"{st} = {info.get('name','')}",
-                "",
-                f"SourceGroup: {info.get('SourceGroup','')}",
-                f"SourceEntry: {info.get('SourceEntry','')}",
-                f"SourceId: {info.get('SourceId','')}",
-                f"ConditionTarget: {info.get('ConditionTarget','')}",
-            ]
-            notes = (info.get("Notes") or "").strip()
-            if notes:
-                parts += ["", f"Notes: {notes}"]
-            tip = "\n".join(parts).strip()
+        # If there are no anchor rows, show nothing (correct) but log why
+        if not rows:
+            self.cond_model.clear()
+            self.log(f"Loaded 0 condition row(s) for quest {quest_id} (no quest-related condition types found: {self.COND_QUEST_TYPES}).")
+            return
 
-        # IMPORTANT: tooltip must be on the dropdown widget
-        w.setToolTip(tip)
+        keys = {
+            (r["SourceTypeOrReferenceId"], r["SourceGroup"], r["SourceEntry"], r["SourceId"])
+            for r in rows
+        }
 
-        # Optional: also set on the backing item (won’t show when hovering widget, but harmless)
-        it = self.cond_table.item(row_idx, col)
-        if it:
-            it.setToolTip(tip)
+        # One model reset -> one layout pass, instead of an insert per row.
+        # Selection signals are held so _on_condition_selected can't fire mid-fill.
+        self._is_loading = True
+        with QSignalBlocker(self.cond_table.selectionModel()):
+            self.cond_model.set_rows([self._cond_model_row(r) for r in rows])
+        self._is_loading = False
+
+        self.log(f"Loaded {len(rows)} condition row(s) for quest {quest_id} across {len(keys)} source group(s).")
+    
+    def _make_choice_model(self, choices: list[tuple[int, str]]) -> QtGui.QStandardItemModel:
+        m = QtGui.QStandardItemModel(self)
+        for v, name in choices:
+            it = QtGui.QStandardItem(f"{v} - {name}")
+            it.setData(v, Qt.ItemDataRole.UserRole)  # what QComboBox.currentData() returns
+            m.appendRow(it)
+        return m
+
+    def _shared_choice_combo(
+        self, shared: QtGui.QStandardItemModel, choices: list[tuple[int, str]], cur: int
+    ) -> QtWidgets.QComboBox:
+        """Combo over the shared choice model; unlisted values get a private list (see _build_choice_combo)."""
+        cb = QtWidgets.QComboBox()
+        cb.setModel(shared)
+        idx = cb.findData(cur)
+        if idx < 0:
+            # Would have to insert a "Reference"/"Unknown" entry -> don't touch the shared model
+            cb.deleteLater()
+            return self._build_choice_combo(choices, cur)
+        cb.setCurrentIndex(idx)
+        return cb
 
     def _build_choice_combo(self, choices: list[tuple[int, str]], cur: int) -> QtWidgets.QComboBox:
         cb = QtWidgets.QComboBox()
@@ -1547,6 +2147,11 @@ class QuestLootEditor(QtWidgets.QWidget):
         cb.setCurrentIndex(0)
         return cb
     
+    def _info(self, msg: str) -> None:
+        """Recoverable, informational: log + status bar instead of a modal box."""
+        self.log(msg)
+        show_status(self, msg)
+
     def _current_loot_editor(self) -> Optional[GenericLootEditor]:
         st = self._selected_source_type()
         return self._editor_for_source.get(st)
@@ -1557,120 +2162,73 @@ class QuestLootEditor(QtWidgets.QWidget):
         """
         ed = self._current_loot_editor()
         if not ed:
-            QtWidgets.QMessageBox.information(self, "No loot editor", "This SourceType has no loot editor tab.")
+            self._info("This SourceType has no loot editor tab.")
             return
 
         key = self._selected_loot_key()
         if not key:
-            QtWidgets.QMessageBox.information(self, "No key", "Select a condition row with SourceGroup/SourceEntry > 0.")
+            self._info("Select a condition row with SourceGroup/SourceEntry > 0.")
             return
 
         entry, item = key
         ed.set_key(entry, item)
-        ed.save_current()  # GenericLootEditor should upsert
+        ed.save()  # GenericLootEditor upserts
         self.log(f"Saved loot via GenericLootEditor: entry={entry} item={item}")
 
     def create_loot_row_if_missing(self) -> None:
         """
-        In the new model, 'save_current' can act as 'create if missing' (upsert).
+        Delegates to GenericLootEditor.create_if_missing (the editor's upsert).
         """
         ed = self._current_loot_editor()
         if not ed:
-            QtWidgets.QMessageBox.information(self, "No loot editor", "This SourceType has no loot editor tab.")
+            self._info("This SourceType has no loot editor tab.")
             return
 
         key = self._selected_loot_key()
         if not key:
-            QtWidgets.QMessageBox.information(self, "No selection", "Select a condition row first.")
+            self._info("Select a condition row first.")
             return
 
         entry, item = key
         ed.set_key(entry, item)
 
-        # If your GenericLootEditor has a load check, use it; otherwise just upsert.
-        ed.save_current()
+        ed.create_if_missing()
         self.log(f"Created/updated loot via GenericLootEditor: entry={entry} item={item}")
 
     def _append_condition_row(self, r: Dict[str, Any]) -> None:
-        row = self.cond_table.rowCount()
-        self.cond_table.insertRow(row)
+        # Not in the DB yet: no stored key (see save_condition_selected)
+        self.cond_model.append_row(self._cond_model_row(r, saved=False))
 
-        # Write DB columns first
-        for i, col in enumerate(self.COND_COLS):
-            val = r.get(col)
-            txt = "" if val is None else str(val)
-
-            # Dropdown for SourceTypeOrReferenceId
-            if col == "SourceTypeOrReferenceId":
-                try:
-                    cur = int(txt.strip() or "0")
-                except Exception:
-                    cur = 0
-
-                cb = self._build_choice_combo(self.SRC_TYPE_CHOICES, cur)
+    def _cond_model_row(self, r: Dict[str, Any], saved: bool = True) -> Dict[str, Any]:
+        row: Dict[str, Any] = {}
 
-                # IMPORTANT: don't allow signals during row build/load
-                cb.blockSignals(True)
-                self.cond_table.setCellWidget(row, i, cb)
-                cb.blockSignals(False)
-
-                # Keep raw value in the cell item too (used by your _cond_row_dict and sorting/visibility)
-                self.cond_table.setItem(row, i, QtWidgets.QTableWidgetItem(str(cur)))
-
-                # Connect AFTER the widget is placed (and after initial selection is set)
-                cb.currentIndexChanged.connect(lambda _=None, cb=cb: self._on_source_type_changed(cb))
-                continue
-
-            # Dropdown for ConditionTypeOrReference
-            if col == "ConditionTypeOrReference":
+        # DB columns; dropdown columns are kept as ints (the model renders the label)
+        for col in self.COND_COLS:
+            val = r.get(col)
+            if col in ("SourceTypeOrReferenceId", "ConditionTypeOrReference"):
                 try:
-                    cur = int(txt.strip() or "0")
+                    val = int(str(val).strip() or "0") if val is not None else 0
                 except Exception:
-                    cur = 0
-
-                cb = self._build_choice_combo(self.COND_TYPE_CHOICES, cur)
-
-                # IMPORTANT: don't allow signals during row build/load
-                cb.blockSignals(True)
-                self.cond_table.setCellWidget(row, i, cb)
-                cb.blockSignals(False)
-
-                # Keep raw value in the cell item too
-                self.cond_table.setItem(row, i, QtWidgets.QTableWidgetItem(str(cur)))
-
-                # Connect AFTER the widget is placed (and after initial selection is set)
-                cb.currentIndexChanged.connect(lambda _=None, cb=cb: self._on_cond_type_changed(cb))
-                continue
-
-            self.cond_table.setItem(row, i, QtWidgets.QTableWidgetItem(txt))
+                    val = 0
+            row[col] = val
 
         # Then display-only columns
-        for j, col in enumerate(self.COND_DISPLAY_COLS):
-            idx = len(self.COND_COLS) + j
+        for col in self.COND_DISPLAY_COLS:
             val = r.get(col, "")
-            item = QtWidgets.QTableWidgetItem("" if val is None else str(val))
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)  # read-only
-            self.cond_table.setItem(row, idx, item)
-        self._refresh_condition_tooltips(row)
+            row[col] = "" if val is None else val
 
+        # Primary key as stored in the DB (not a column; lets a save patch the row in place)
+        row["_pk"] = tuple(row[c] for c in self.COND_PK) if saved else None
+        return row
 
-    def _on_source_type_changed(self, cb: QtWidgets.QComboBox) -> None:
-        # Find owning row
-        row_idx = -1
-        col_idx = self.COND_COLS.index("SourceTypeOrReferenceId")
-        for r in range(self.cond_table.rowCount()):
-            if self.cond_table.cellWidget(r, col_idx) is cb:
-                row_idx = r
-                break
-        if row_idx < 0:
-            return
+    def _on_cond_value_edited(self, row_idx: int, col_name: str) -> None:
+        if col_name == "SourceTypeOrReferenceId":
+            self._on_source_type_changed(row_idx)
+        elif col_name == "ConditionTypeOrReference":
+            self._on_cond_type_changed(row_idx)
 
-        st = int(cb.currentData() or 0)
-
-        # Sync backing cell text
-        it = self.cond_table.item(row_idx, col_idx)
-        if it:
-            it.setText(str(st))
+    def _on_source_type_changed(self, row_idx: int) -> None:
+        st = self._get_cell_int(row_idx, "SourceTypeOrReferenceId", 0)
 
         # Refresh ALL tooltips for the row (includes SourceType tooltip)
         self._refresh_condition_tooltips(row_idx)
@@ -1680,23 +2238,18 @@ class QuestLootEditor(QtWidgets.QWidget):
             self.right_tabs.setCurrentIndex(self._tab_for_source[st])
 
     def _get_cell_int(self, row: int, col_name: str, default: int = 0) -> int:
-        col = self.COND_COLS.index(col_name)
-        it = self.cond_table.item(row, col)
-        if not it:
+        v = self.cond_model.value(row, col_name)
+        # CondModel keeps numeric columns as ints (DB rows and setData both), so
+        # the common case is a plain dict read with no text parsing.
+        if type(v) is int:
+            return v
+        if v is None:
             return default
         try:
-            return int((it.text() or "").strip() or default)
+            return int(str(v).strip() or default)
         except Exception:
             return default
 
-    def _ensure_cell(self, row: int, col_name: str) -> QtWidgets.QTableWidgetItem:
-        col = self.COND_COLS.index(col_name)
-        it = self.cond_table.item(row, col)
-        if it is None:
-            it = QtWidgets.QTableWidgetItem("")
-            self.cond_table.setItem(row, col, it)
-        return it
-
     def _apply_source_type_defaults(self, row_idx: int, stype: int) -> None:
         """
         Apply SourceTypeOrReferenceId rules ONLY when the user changes SourceTypeOrReferenceId.
@@ -1915,48 +2468,19 @@ class QuestLootEditor(QtWidgets.QWidget):
         # Anything else: keep CV2/CV3 at 0 only if empty
 
     def _cond_row_dict(self, row: int) -> Dict[str, Any]:
-        d: Dict[str, Any] = {}
-        for i, col in enumerate(self.COND_COLS):
-            it = self.cond_table.item(row, i)
-            if col == "SourceTypeOrReferenceId":
-                w = self.cond_table.cellWidget(row, i)
-                if isinstance(w, QtWidgets.QComboBox):
-                    d[col] = int(w.currentData() or 0)
-                    continue
-
-            if col == "ConditionTypeOrReference":
-                w = self.cond_table.cellWidget(row, i)
-                if isinstance(w, QtWidgets.QComboBox):
-                    d[col] = int(w.currentData() or 0)
-                    continue
-
-            txt = it.text().strip() if it else ""
-
-            if col == "Comment":
-                d[col] = None if txt == "" else txt
-                continue
-            if col == "ScriptName":
-                d[col] = txt
-                continue
-
-            # numeric columns
-            d[col] = int(txt) if txt != "" else 0
-        return d
+        src = self.cond_model.row(row)
+        return {col: dec(src.get(col)) for col, dec in self._COND_DECODERS}
 
     def _set_cell_int(self, row: int, col_name: str, value: int) -> None:
-        col = self.COND_COLS.index(col_name)
-        it = self.cond_table.item(row, col)
-        if it is None:
-            it = QtWidgets.QTableWidgetItem("")
-            self.cond_table.setItem(row, col, it)
-        it.setText(str(int(value)))
+        self.cond_model.set_value(row, col_name, int(value))
 
     def _selected_condition_row(self) -> int:
-        return self.cond_table.currentRow()
+        idx = self.cond_table.currentIndex()
+        return idx.row() if idx.isValid() else -1
 
     def add_condition_row(self) -> None:
         if self.quest_id is None:
-            QtWidgets.QMessageBox.information(self, "No quest", "Load a quest first.")
+            self._info("Load a quest first.")
             return
 
         # All DB fields default to 0 (or empty strings where appropriate)
@@ -1975,9 +2499,10 @@ class QuestLootEditor(QtWidgets.QWidget):
 
         # Append + select
         self._append_condition_row(r)
-        new_row = self.cond_table.rowCount() - 1
-        self.cond_table.setCurrentCell(new_row, 0)
-        self.cond_table.scrollToItem(self.cond_table.item(new_row, 0))
+        new_row = self.cond_model.rowCount() - 1
+        idx = self.cond_model.index(new_row, 0)
+        self.cond_table.setCurrentIndex(idx)
+        self.cond_table.scrollTo(idx)
 
         # Tooltips (safe now because new_row always exists)
         self._refresh_condition_tooltips(new_row)
@@ -1986,12 +2511,12 @@ class QuestLootEditor(QtWidgets.QWidget):
 
     def save_condition_selected(self) -> None:
         if self.quest_id is None:
-            QtWidgets.QMessageBox.information(self, "No quest", "Load a quest first.")
+            self._info("Load a quest first.")
             return
 
         row = self._selected_condition_row()
         if row < 0:
-            QtWidgets.QMessageBox.information(self, "Pick a row", "Select a condition row to save.")
+            self._info("Select a condition row to save.")
             return
 
         d = self._cond_row_dict(row)
@@ -2037,55 +2562,44 @@ class QuestLootEditor(QtWidgets.QWidget):
                 QtWidgets.QMessageBox.warning(self, "Missing SourceEntry", "Set SourceEntry (item id).")
                 return
 
-        insert_cols = ",".join([f"`{c}`" for c in self.COND_COLS])
-        placeholders = ",".join(["%s"] * len(self.COND_COLS))
-
-        non_pk = [c for c in self.COND_COLS if c not in self.COND_PK]
-        updates = ",".join([f"`{c}`=VALUES(`{c}`)" for c in non_pk])
-
-        sql = f"""
-        INSERT INTO conditions ({insert_cols})
-        VALUES ({placeholders})
-        ON DUPLICATE KEY UPDATE {updates}
-        """
-
         params = [d[c] for c in self.COND_COLS]
+        pk = tuple(d[c] for c in self.COND_PK)
+        seq = self._cond_seq
 
-        try:
-            self.db.execute(sql, params)
-            self.db.commit()
+        def run() -> Dict[str, Any]:
+            self.db.execute(self._UPSERT_SQL, params)
+            # Display names for just this row (cached lookups, see _lookup_condition_names)
+            return self._lookup_condition_names([d])
+
+        def done(found: Dict[str, Dict[int, str]]) -> None:
+            names = {"SourceGroup": d["SourceGroup"], "SourceEntry": d["SourceEntry"]}
+            self._apply_condition_names([names], found)
             self.log(
                 "Upserted condition row: "
                 f"ST={d['SourceTypeOrReferenceId']} SG={d['SourceGroup']} SE={d['SourceEntry']} "
                 f"CT={d['ConditionTypeOrReference']} Q={d['ConditionValue1']} SourceId={d['SourceId']}"
             )
 
-            # Reload so display columns refresh
+            # Same key as loaded (or a new row) and no reload since: the UPSERT updated
+            # exactly this row, so patch it. A changed key inserted a NEW row and left
+            # the old one in place -> reload to show both.
+            stored = self.cond_model.row(row).get("_pk") if seq == self._cond_seq else ()
+            if stored is None or stored == pk:
+                patch = self._cond_model_row(d)
+                patch["SourceGroupName"] = names["SourceGroupName"]
+                patch["ItemName"] = names["ItemName"]
+                self.cond_model.update_row(row, patch)
+                return
             self._load_conditions()
 
-        except Exception as e:
-            self.db.rollback()
+        def failed(e: Exception) -> None:
             QtWidgets.QMessageBox.critical(self, "Save failed", str(e))
             self.log(f"ERROR saving condition row: {e}")
 
-    def _on_cond_type_changed(self, cb: QtWidgets.QComboBox) -> None:
-        # Find which row owns this combobox (cheap scan; row counts are small)
-        row_idx = -1
-        col_idx = self.COND_COLS.index("ConditionTypeOrReference")
-        for r in range(self.cond_table.rowCount()):
-            if self.cond_table.cellWidget(r, col_idx) is cb:
-                row_idx = r
-                break
-        if row_idx < 0:
-            return
-
-        ctype = int(cb.currentData() or 0)
-
-        # Keep the underlying item text in sync (optional but nice)
-        it = self.cond_table.item(row_idx, col_idx)
-        if it:
-            it.setText(str(ctype))
+        # UPSERT + commit run on a worker; rollback happens there on failure
+        self._run_db_job(self._in_txn, run, on_done=done, on_error=failed)
 
+    def _on_cond_type_changed(self, row_idx: int) -> None:
         # Don't do anything else while loading rows from DB
         if self._is_loading:
             return
@@ -2093,92 +2607,150 @@ class QuestLootEditor(QtWidgets.QWidget):
         # NO AUTO-FILL. Only refresh tooltips based on the selected type.
         self._refresh_condition_tooltips(row_idx)
 
+    def _selected_condition_rows(self) -> List[int]:
+        rows = sorted({i.row() for i in self.cond_table.selectionModel().selectedRows()})
+        if not rows:
+            cur = self._selected_condition_row()
+            rows = [cur] if cur >= 0 else []
+        return rows
+
+    def _group_delete_stmts(self, st: int, sg: int, se: int, sid: int, quest_id: int) -> List[Tuple[str, List[Any]]]:
+        """
+        (sql, params) statements deleting a whole condition group (all conditions
+        with the same source key) and, for loot sources, the matching loot row.
+        The loot DELETE is its own statement so it runs even when no condition
+        row matches any more (group already removed elsewhere, stale view).
+        """
+        stmts: List[Tuple[str, List[Any]]] = [(
+            """
+            DELETE FROM conditions
+            WHERE SourceTypeOrReferenceId=%s
+              AND SourceGroup=%s
+              AND SourceEntry=%s
+              AND SourceId=%s
+              AND ConditionValue1=%s
+            """,
+            [st, sg, se, sid, quest_id],
+        )]
+        if st in self.LOOT_TABS and sg > 0 and se > 0:
+            table = self.LOOT_TABS[st][1]
+            stmts.append((f"DELETE FROM {table} WHERE entry=%s AND item=%s", [sg, se]))
+        return stmts
+
     def delete_condition_selected(self) -> None:
         if self.quest_id is None:
             return
-        row = self._selected_condition_row()
-        if row < 0:
+        rows = self._selected_condition_rows()
+        if not rows:
             return
 
-        d = self._cond_row_dict(row)
-
-        sg = int(d.get("SourceGroup", 0))
-        se = int(d.get("SourceEntry", 0))
-        st = int(d.get("SourceTypeOrReferenceId", 0))
-        sid = int(d.get("SourceId", 0))
-        ctype = int(d.get("ConditionTypeOrReference", 0))
-        cv1 = int(d.get("ConditionValue1", 0))
+        quest_id = int(self.quest_id)
 
         # Anchor rows are what your loader uses to “find” a group
-        is_anchor = (ctype == 2 and cv1 == int(self.quest_id))
-
-        msg = (
-            "Delete the ENTIRE condition group (and its loot row)?\n\n"
-            f"SG={sg} SE={se} SourceId={sid} (anchor row)\n\n"
-            "This will delete ALL conditions sharing this SourceId and the matching loot row."
-            if is_anchor else
-            "Delete ONLY this single condition row?\n\n"
-            f"SG={sg} SE={se} SourceId={sid} CType={ctype}"
-        )
+        groups: List[Tuple[int, int, int, int]] = []   # (st, sg, se, sid) of selected anchors
+        singles: List[List[Any]] = []                  # COND_PK values of selected non-anchors
+        for row in rows:
+            d = self._cond_row_dict(row)
+            ctype = int(d.get("ConditionTypeOrReference", 0))
+            cv1 = int(d.get("ConditionValue1", 0))
+            if ctype == 2 and cv1 == quest_id:
+                groups.append((
+                    int(d.get("SourceTypeOrReferenceId", 0)),
+                    int(d.get("SourceGroup", 0)),
+                    int(d.get("SourceEntry", 0)),
+                    int(d.get("SourceId", 0)),
+                ))
+            else:
+                singles.append([d.get(k, 0) for k in self.COND_PK])
+
+        if len(rows) == 1:
+            d = self._cond_row_dict(rows[0])
+            sg = int(d.get("SourceGroup", 0))
+            se = int(d.get("SourceEntry", 0))
+            sid = int(d.get("SourceId", 0))
+            ctype = int(d.get("ConditionTypeOrReference", 0))
+            msg = (
+                "Delete the ENTIRE condition group (and its loot row)?\n\n"
+                f"SG={sg} SE={se} SourceId={sid} (anchor row)\n\n"
+                "This will delete ALL conditions sharing this SourceId and the matching loot row."
+                if groups else
+                "Delete ONLY this single condition row?\n\n"
+                f"SG={sg} SE={se} SourceId={sid} CType={ctype}"
+            )
+        else:
+            msg = f"Delete the {len(rows)} selected condition rows?"
+            if groups:
+                msg += (
+                    f"\n\n{len(groups)} of them are anchor rows: their ENTIRE condition groups "
+                    "and matching loot rows will be deleted too."
+                )
 
         ok = QtWidgets.QMessageBox.question(self, "Confirm Delete", msg)
         if ok != QtWidgets.QMessageBox.StandardButton.Yes:
             return
 
-        try:
-            if is_anchor:
-                # Delete the whole group (all conditions with the same source key)
-                n = self.db.execute(
-                    """
-                    DELETE FROM conditions
-                    WHERE SourceTypeOrReferenceId=%s
-                      AND SourceGroup=%s
-                      AND SourceEntry=%s
-                      AND SourceId=%s
-                      AND ConditionValue1=%s
-                    """,
-                    (st, sg, se, sid, int(self.quest_id)),
-                )
-
-                # Also delete the corresponding loot row
-                if st in self.LOOT_TABS and sg > 0 and se > 0:
-                    table = self.LOOT_TABS[st][1]
-                    self.db.execute(
-                        f"DELETE FROM {table} WHERE entry=%s AND item=%s",
-                        (sg, se),
-                    )
-
-
-            else:
+        # A staged upsert for a deleted loot row would write it back on the next flush
+        for st, sg, se, _sid in groups:
+            if st in self.LOOT_TABS:
+                self.loot_txn.discard((self.LOOT_TABS[st][1], sg, se))
+
+        def run() -> int:
+            # Everything runs in one transaction (_in_txn): one COMMIT for the whole batch,
+            # and all statements go out in a single multi-statement round trip.
+            stmts: List[str] = []
+            params: List[Any] = []
+            for st, sg, se, sid in groups:
+                for sql, p in self._group_delete_stmts(st, sg, se, sid, quest_id):
+                    stmts.append(sql)
+                    params += p
+            if len(singles) == 1:
                 # Delete ONLY the selected row (exact composite key)
-                where = " AND ".join([f"`{k}`=%s" for k in self.COND_PK])
-                sql = f"DELETE FROM conditions WHERE {where}"
-                params = [d.get(k, 0) for k in self.COND_PK]
-                n = self.db.execute(sql, params)
-
-            self.db.commit()
-            self.log(f"Deleted {n} condition row(s).")
+                stmts.append(self._SQL_DELETE_COND_ONE)
+                params += singles[0]
+            elif singles:
+                # Exact composite keys; one row-constructor IN list for all of them
+                tuple_ph = "(" + ",".join(["%s"] * len(self.COND_PK)) + ")"
+                stmts.append(self._SQL_DELETE_COND_MANY_HEAD + ",".join([tuple_ph] * len(singles)) + ")")
+                params += [v for pk in singles for v in pk]
+            if len(stmts) == 1:
+                return self.db.execute(stmts[0], params)
+            return sum(self.db.execute_multi(";\n".join(stmts), params))
+
+        def done(n: int) -> None:
+            self.log(f"Deleted {n} row(s).")
+            for st, sg, se, _sid in groups:
+                ed = self._editor_for_source.get(st)
+                if ed:
+                    ed.invalidate(sg, se)
             self.clear_loot_form()
             self._load_conditions()
 
-        except Exception as e:
-            self.db.rollback()
+        def failed(e: Exception) -> None:
             QtWidgets.QMessageBox.critical(self, "Delete failed", str(e))
             self.log(f"ERROR deleting condition(s): {e}")
 
+        self._run_db_job(self._in_txn, run, on_done=done, on_error=failed)
+
     def _selected_source_type(self) -> int:
+        return self._selection_info()[1]
+
+    def _drop_sel_cache(self, *_: Any) -> None:
+        self._sel_cache = None
+
+    def _selection_info(self) -> Tuple[int, int, Optional[Tuple[int, int]]]:
+        """(row, SourceType, (entry,item) or None) for the current row, memoized per selection."""
+        if self._sel_cache is not None:
+            return self._sel_cache
         row = self._selected_condition_row()
         if row < 0:
-            return 0
-        col = self.COND_COLS.index("SourceTypeOrReferenceId")
-        w = self.cond_table.cellWidget(row, col)
-        if isinstance(w, QtWidgets.QComboBox):
-            return int(w.currentData() or 0)
-        it = self.cond_table.item(row, col)
-        try:
-            return int((it.text() if it else "0").strip() or "0")
-        except Exception:
-            return 0
+            info: Tuple[int, int, Optional[Tuple[int, int]]] = (-1, 0, None)
+        else:
+            st = self._get_cell_int(row, "SourceTypeOrReferenceId", 0)
+            entry = self._get_cell_int(row, "SourceGroup", 0)
+            item = self._get_cell_int(row, "SourceEntry", 0)
+            info = (row, st, (entry, item) if entry > 0 and item > 0 else None)
+        self._sel_cache = info
+        return info
 
     def _on_condition_selected(self) -> None:
         row = self._selected_condition_row()
@@ -2212,156 +2784,84 @@ class QuestLootEditor(QtWidgets.QWidget):
     
     def _refresh_condition_tooltips(self, row_idx: int) -> None:
         """
-        Apply per-field tooltips based on the current SourceTypeOrReferenceId and ConditionTypeOrReference.
-        No values are auto-changed here — tooltips only.
+        Tooltips are served by CondModel (ToolTipRole -> _condition_tooltip); this just
+        tells the view the row's tooltips changed. No values are auto-changed here.
         """
-        if row_idx < 0 or row_idx >= self.cond_table.rowCount():
-            return
-
-        # Prefer reading from dropdown widgets (source of truth)
-        st = 0
-        ct = 0
+        self.cond_model.refresh_row(row_idx)
 
-        # --- SourceTypeOrReferenceId ---
-        try:
-            st_col = self.COND_COLS.index("SourceTypeOrReferenceId")
-            st_w = self.cond_table.cellWidget(row_idx, st_col)
-            if isinstance(st_w, QtWidgets.QComboBox):
-                st = int(st_w.currentData() or 0)
-            else:
-                it = self.cond_table.item(row_idx, st_col)
-                st = int((it.text() if it else "0").strip() or "0")
-        except Exception:
-            st = 0
+    def _condition_tooltip(self, row_idx: int, field: str) -> Optional[str]:
+        """
+        Per-field tooltip based on the row's SourceTypeOrReferenceId and ConditionTypeOrReference.
+        """
+        if field in ("SourceTypeOrReferenceId", "SourceGroup", "SourceEntry", "SourceId", "ConditionTarget"):
+            st = self._get_cell_int(row_idx, "SourceTypeOrReferenceId", 0)
 
-        # --- ConditionTypeOrReference ---
-        try:
-            ct_col = self.COND_COLS.index("ConditionTypeOrReference")
-            ct_w = self.cond_table.cellWidget(row_idx, ct_col)
-            if isinstance(ct_w, QtWidgets.QComboBox):
-                ct = int(ct_w.currentData() or 0)
-            else:
-                it = self.cond_table.item(row_idx, ct_col)
-                ct = int((it.text() if it else "0").strip() or "0")
-        except Exception:
-            ct = 0
-
-        # =========================
-        # SourceType tooltips
-        # =========================
-        if st < 0:
-            st_tip = (
-                "SourceTypeOrReferenceId is NEGATIVE:\n"
-                "• This is a reference id.\n"
-                "• It is referenced directly in ConditionTypeOrReference of another condition.\n"
-                "• SourceGroup/SourceEntry meaning is defined by the referenced rule.\n"
-            )
-        else:
-            info = self.SRC_TOOLTIP_MAP.get(st)
-            if info:
+            # =========================
+            # SourceType tooltips
+            # =========================
+            if field == "SourceTypeOrReferenceId":
+                if st < 0:
+                    return (
+                        "SourceTypeOrReferenceId is NEGATIVE:\n"
+                        "• This is a reference id.\n"
+                        "• It is referenced directly in ConditionTypeOrReference of another condition.\n"
+                        "• SourceGroup/SourceEntry meaning is defined by the referenced rule.\n"
+                    )
+                info = self.SRC_TOOLTIP_MAP.get(st)
+                if not info:
+                    return self.SRC_TOOLTIP_HEADER
                 name = info.get("name", f"SourceType {st}")
-                sg = info.get("SourceGroup", "")
-                se = info.get("SourceEntry", "")
-                sid = info.get("SourceId", "")
-                tgt = info.get("ConditionTarget", "")
                 notes = info.get("Notes", "")
-
-                st_tip = (
+                return (
                     f"{name}\n\n"
                     "What goes where:\n"
-                    f"• SourceGroup = {sg}\n"
-                    f"• SourceEntry = {se}\n"
-                    f"• SourceId = {sid}\n"
-                    f"• ConditionTarget = {tgt}\n"
+                    f"• SourceGroup = {info.get('SourceGroup', '')}\n"
+                    f"• SourceEntry = {info.get('SourceEntry', '')}\n"
+                    f"• SourceId = {info.get('SourceId', '')}\n"
+                    f"• ConditionTarget = {info.get('ConditionTarget', '')}\n"
                     + (f"\nNotes:\n{notes}\n" if notes else "")
                 )
-            else:
-                st_tip = self.SRC_TOOLTIP_HEADER
-
-        # Apply tooltip to SourceType dropdown widget
-        try:
-            col = self.COND_COLS.index("SourceTypeOrReferenceId")
-            w = self.cond_table.cellWidget(row_idx, col)
-            if w:
-                w.setToolTip(st_tip)
-        except Exception:
-            pass
 
-        # Apply tooltips to SourceGroup/SourceEntry/SourceId/ConditionTarget cells
-        for field in ("SourceGroup", "SourceEntry", "SourceId", "ConditionTarget"):
-            try:
-                col = self.COND_COLS.index(field)
-                item = self.cond_table.item(row_idx, col)
-                if not item:
-                    item = QtWidgets.QTableWidgetItem("")
-                    self.cond_table.setItem(row_idx, col, item)
+            # SourceGroup/SourceEntry/SourceId/ConditionTarget cells
+            if st < 0:
+                return "Reference-based SourceType (negative). Meaning depends on reference usage."
+            info = self.SRC_TOOLTIP_MAP.get(st, {})
+            return f"{field}:\n{info.get(field, '')}".strip()
 
-                if st < 0:
-                    item.setToolTip("Reference-based SourceType (negative). Meaning depends on reference usage.")
-                else:
-                    info = self.SRC_TOOLTIP_MAP.get(st, {})
-                    item.setToolTip(f"{field}:\n{info.get(field, '')}".strip())
-            except Exception:
-                pass
+        if field in ("ConditionTypeOrReference", "ConditionValue1", "ConditionValue2", "ConditionValue3"):
+            ct = self._get_cell_int(row_idx, "ConditionTypeOrReference", 0)
 
-        # =========================
-        # ConditionType tooltips
-        # =========================
-        if ct < 0:
-            ct_tip = (
-                "ConditionTypeOrReference is NEGATIVE:\n"
-                "• This is a reference to another condition.\n"
-                "• ConditionValue1/2/3 meaning depends on the referenced rule.\n"
-            )
-        else:
-            info = self.COND_TOOLTIP_MAP.get(ct)
-            if info:
-                ct_tip = (
+            # =========================
+            # ConditionType tooltips
+            # =========================
+            if field == "ConditionTypeOrReference":
+                if ct < 0:
+                    return (
+                        "ConditionTypeOrReference is NEGATIVE:\n"
+                        "• This is a reference to another condition.\n"
+                        "• ConditionValue1/2/3 meaning depends on the referenced rule.\n"
+                    )
+                info = self.COND_TOOLTIP_MAP.get(ct)
+                if not info:
+                    return self.COND_TOOLTIP_HEADER
+                return (
                     f"{info.get('name','')}\n\n"
                     f"CV1: {info.get('ConditionValue1','')}\n"
                     f"CV2: {info.get('ConditionValue2','')}\n"
                     f"CV3: {info.get('ConditionValue3','')}\n"
                     + (f"\nUsage: {info.get('Usage','')}\n" if info.get("Usage") else "")
                 )
-            else:
-                ct_tip = self.COND_TOOLTIP_HEADER
 
-        # Apply tooltip to ConditionType dropdown widget
-        try:
-            col = self.COND_COLS.index("ConditionTypeOrReference")
-            w = self.cond_table.cellWidget(row_idx, col)
-            if w:
-                w.setToolTip(ct_tip)
-        except Exception:
-            pass
+            # ConditionValue1/2/3 cells
+            if ct < 0:
+                return "Reference-based ConditionType (negative). Meaning depends on referenced rule."
+            info = self.COND_TOOLTIP_MAP.get(ct, {})
+            return f"{field}:\n{info.get(field,'')}".strip()
 
-        # Apply tooltips to ConditionValue1/2/3 cells
-        for field in ("ConditionValue1", "ConditionValue2", "ConditionValue3"):
-            try:
-                col = self.COND_COLS.index(field)
-                item = self.cond_table.item(row_idx, col)
-                if not item:
-                    item = QtWidgets.QTableWidgetItem("")
-                    self.cond_table.setItem(row_idx, col, item)
-
-                if ct < 0:
-                    item.setToolTip("Reference-based ConditionType (negative). Meaning depends on referenced rule.")
-                else:
-                    info = self.COND_TOOLTIP_MAP.get(ct, {})
-                    item.setToolTip(f"{field}:\n{info.get(field,'')}".strip())
-            except Exception:
-                pass
+        return None
 
     def _selected_loot_key(self) -> Optional[tuple[int, int]]:
-        row = self._selected_condition_row()
-        if row < 0:
-            return None
-        d = self._cond_row_dict(row)
-        entry = int(d.get("SourceGroup", 0))
-        item = int(d.get("SourceEntry", 0))
-        if entry <= 0 or item <= 0:
-            return None
-        return (entry, item)
+        return self._selection_info()[2]
     
     def clear_loot_form(self) -> None:
         """
@@ -11,8 +11,8 @@ from db import Database
 import struct
 from pathlib import Path
 
-from metadata import QUEST_TABS
-from widgets.loot_editor import QuestLootEditor
+from metadata import COL_TO_FTYPE, QUEST_TABS
+from widgets.loot_editor import QuestLootEditor, load_wdbc_id_name
 
 from PyQt6.QtGui import QKeySequence, QShortcut
 
@@ -67,81 +67,6 @@ def load_skillline_dbc(path: str) -> list[tuple[int, str]]:
             rows.append((skill_id, name))
 
     return rows
-def load_wdbc_id_name(
-    path: str,
-    *,
-    name_field_index: Optional[int] = None,
-    candidate_name_fields: Optional[List[int]] = None,
-    max_rows_scan: int = 200,
-) -> list[tuple[int, str]]:
-    """
-    Generic WDBC reader for "ID + Name" tables.
-
-    - ID is always fields[0]
-    - Name is a string offset at some field index.
-
-    If name_field_index is not provided, we try candidate_name_fields
-    (or a reasonable default set) and pick the field index that yields
-    the most non-empty printable names in the first max_rows_scan rows.
-    """
-    import struct
-
-    data = Path(path).read_bytes()
-    magic4 = data[:4]
-    if magic4 != b"WDBC":
-        raise ValueError(f"Not a valid WDBC file. Magic={magic4!r}")
-
-    _magic, rec_count, field_count, rec_size, str_size = struct.unpack_from("<4s4I", data, 0)
-    records_off = 20
-    strings_off = records_off + rec_count * rec_size
-    string_block = data[strings_off : strings_off + str_size]
-
-    ints_per_record = rec_size // 4
-
-    def read_cstr(off: int) -> str:
-        if off <= 0 or off >= len(string_block):
-            return ""
-        end = string_block.find(b"\x00", off)
-        if end == -1:
-            return ""
-        return string_block[off:end].decode("utf-8", "ignore").strip()
-
-    # Choose a name field index if not provided
-    if name_field_index is None:
-        cands = candidate_name_fields or [
-            1, 2, 3, 4, 5, 6, 7, 8,
-            10, 11, 12, 13, 14,
-            20, 21, 22, 23, 24, 25, 26, 27, 28,
-        ]
-        best_idx = None
-        best_score = -1
-        scan_n = min(rec_count, max_rows_scan)
-        for idx in cands:
-            score = 0
-            for i in range(scan_n):
-                roff = records_off + i * rec_size
-                fields = struct.unpack_from("<" + "I" * ints_per_record, data, roff)
-                if idx >= len(fields):
-                    continue
-                s = read_cstr(int(fields[idx]))
-                if s and any(ch.isalpha() for ch in s):
-                    score += 1
-            if score > best_score:
-                best_score = score
-                best_idx = idx
-        name_field_index = best_idx if best_idx is not None else 1
-
-    out: list[tuple[int, str]] = []
-    for i in range(rec_count):
-        roff = records_off + i * rec_size
-        fields = struct.unpack_from("<" + "I" * ints_per_record, data, roff)
-        rid = int(fields[0]) if fields else 0
-        noff = int(fields[name_field_index]) if len(fields) > name_field_index else 0
-        name = read_cstr(noff) if noff else ""
-        if rid:
-            out.append((rid, name or f"ID {rid}"))
-    out.sort(key=lambda t: (t[1] or "").lower())
-    return out
 
 QUEST_ID_MIN = 1000000
 QUEST_ID_MAX = 2000000
@@ -925,6 +850,7 @@ class QuestEditor(QtWidgets.QWidget):
         # MUST exist before _build_tabs()
         self.current_id: Optional[int] = None
         self._orig: Dict[str, Any] = {}
+        self._load_seq = 0
         self._widgets: Dict[str, QtWidgets.QWidget] = {}
         self._soc_mode: Dict[str, QtWidgets.QComboBox] = {}
         self._soc_hint: Dict[str, QtWidgets.QLabel] = {}
@@ -933,7 +859,7 @@ class QuestEditor(QtWidgets.QWidget):
         self._zos_hint: Dict[str, QtWidgets.QLabel] = {}
         self._zos_refresh: Dict[str, Callable[[], None]] = {}   # ✅ add this
 
-        self._ftypes: Dict[str, str] = {}  # col -> ftype from metadata
+        self._ftypes: Dict[str, str] = COL_TO_FTYPE  # col -> ftype from metadata (shared, read-only)
 
         # Inline lookup labels: col -> QLabel
         self._name_labels: Dict[str, QtWidgets.QLabel] = {}
@@ -971,9 +897,11 @@ class QuestEditor(QtWidgets.QWidget):
         self.relations = QuestRelationPanel(self.db, self.log, self)
         self.tabs.addTab(self.relations, "Starters / Enders")
 
-        # Quest Loot Conditions tab
-        self.quest_loot = QuestLootEditor(self.db, self.log, self)
-        self.tabs.addTab(self.quest_loot, "Quest Loot Conditions")
+        # Quest Loot Conditions tab: built the first time it is shown (see _ensure_quest_loot)
+        self.quest_loot: Optional[QuestLootEditor] = None
+        self._loot_stub = QtWidgets.QLabel("Loading loot conditions…")
+        self._loot_stub.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.tabs.addTab(self._loot_stub, "Quest Loot Conditions")
 
         # Auto-load loot editor when its tab is selected
         self.tabs.currentChanged.connect(self._on_tab_changed)
@@ -1418,52 +1346,52 @@ class QuestEditor(QtWidgets.QWidget):
             )
             return
 
-        data = dbc_path.read_bytes()
-        magic4 = data[:4]
+        with config.dbc(dbc_path) as data:
+            magic4 = data[:4]
 
-        if magic4 != b"WDBC":
-            QtWidgets.QMessageBox.critical(
-                self,
-                "DBC Error",
-                f"Not a valid WDBC file. Magic={magic4!r}\n\nPath:\n{dbc_path}",
-            )
-            return
+            if magic4 != b"WDBC":
+                QtWidgets.QMessageBox.critical(
+                    self,
+                    "DBC Error",
+                    f"Not a valid WDBC file. Magic={magic4!r}\n\nPath:\n{dbc_path}",
+                )
+                return
 
-        try:
-            _magic, rec_count, field_count, rec_size, str_size = struct.unpack_from("<4s4I", data, 0)
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "DBC Error", f"Header parse failed: {e}")
-            return
+            try:
+                _magic, rec_count, field_count, rec_size, str_size = struct.unpack_from("<4s4I", data, 0)
+            except Exception as e:
+                QtWidgets.QMessageBox.critical(self, "DBC Error", f"Header parse failed: {e}")
+                return
 
-        records_off = 20
-        strings_off = records_off + rec_count * rec_size
-        string_block = data[strings_off:strings_off + str_size]
+            records_off = 20
+            strings_off = records_off + rec_count * rec_size
+            string_block = data[strings_off:strings_off + str_size]
 
-        def read_cstr(off: int) -> str:
-            if off < 0 or off >= len(string_block):
-                return ""
-            end = string_block.find(b"\x00", off)
-            if end == -1:
-                return ""
-            raw = string_block[off:end]
-            return raw.decode("utf-8", "ignore").strip()
+            def read_cstr(off: int) -> str:
+                if off < 0 or off >= len(string_block):
+                    return ""
+                end = string_block.find(b"\x00", off)
+                if end == -1:
+                    return ""
+                raw = string_block[off:end]
+                return raw.decode("utf-8", "ignore").strip()
 
-        out: List[Tuple[int, str]] = []
-        ints_per_record = rec_size // 4
+            out: List[Tuple[int, str]] = []
+            ints_per_record = rec_size // 4
 
-        for i in range(rec_count):
-            roff = records_off + i * rec_size
-            fields = struct.unpack_from("<" + "I" * ints_per_record, data, roff)
+            for i in range(rec_count):
+                roff = records_off + i * rec_size
+                fields = struct.unpack_from("<" + "I" * ints_per_record, data, roff)
 
-            aid = int(fields[0])
-            name_off = int(fields[11]) if len(fields) > 11 else 0
-            name = read_cstr(name_off) if 0 <= name_off < str_size else ""
+                aid = int(fields[0])
+                name_off = int(fields[11]) if len(fields) > 11 else 0
+                name = read_cstr(name_off) if 0 <= name_off < str_size else ""
 
-            if not name:
-                name = f"Area {aid}"
+                if not name:
+                    name = f"Area {aid}"
 
-            if aid:
-                out.append((aid, name))
+                if aid:
+                    out.append((aid, name))
 
         out.sort(key=lambda t: t[1].lower())
 
@@ -1574,52 +1502,52 @@ class QuestEditor(QtWidgets.QWidget):
             )
             return
 
-        data = dbc_path.read_bytes()
-        magic4 = data[:4]
-        if magic4 != b"WDBC":
-            QtWidgets.QMessageBox.critical(
-                self,
-                "DBC Error",
-                f"Not a valid WDBC file. Magic={magic4!r}\n\nPath:\n{dbc_path}",
-            )
-            return
+        with config.dbc(dbc_path) as data:
+            magic4 = data[:4]
+            if magic4 != b"WDBC":
+                QtWidgets.QMessageBox.critical(
+                    self,
+                    "DBC Error",
+                    f"Not a valid WDBC file. Magic={magic4!r}\n\nPath:\n{dbc_path}",
+                )
+                return
 
-        # ---- header ----
-        try:
-            _magic, rec_count, field_count, rec_size, str_size = struct.unpack_from("<4s4I", data, 0)
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "DBC Error", f"Header parse failed: {e}")
-            return
+            # ---- header ----
+            try:
+                _magic, rec_count, field_count, rec_size, str_size = struct.unpack_from("<4s4I", data, 0)
+            except Exception as e:
+                QtWidgets.QMessageBox.critical(self, "DBC Error", f"Header parse failed: {e}")
+                return
 
-        records_off = 20
-        strings_off = records_off + rec_count * rec_size
-        string_block = data[strings_off:strings_off + str_size]
+            records_off = 20
+            strings_off = records_off + rec_count * rec_size
+            string_block = data[strings_off:strings_off + str_size]
 
-        def read_cstr(off: int) -> str:
-            if off < 0 or off >= len(string_block):
-                return ""
-            end = string_block.find(b"\x00", off)
-            if end == -1:
-                return ""
-            return string_block[off:end].decode("utf-8", "ignore").strip()
+            def read_cstr(off: int) -> str:
+                if off < 0 or off >= len(string_block):
+                    return ""
+                end = string_block.find(b"\x00", off)
+                if end == -1:
+                    return ""
+                return string_block[off:end].decode("utf-8", "ignore").strip()
 
-        ints_per_record = rec_size // 4
-        out: list[tuple[int, str]] = []
+            ints_per_record = rec_size // 4
+            out: list[tuple[int, str]] = []
 
-        for i in range(rec_count):
-            roff = records_off + i * rec_size
-            fields = struct.unpack_from("<" + "I" * ints_per_record, data, roff)
+            for i in range(rec_count):
+                roff = records_off + i * rec_size
+                fields = struct.unpack_from("<" + "I" * ints_per_record, data, roff)
 
-            sid = int(fields[0]) if len(fields) > 0 else 0
-            name_off = int(fields[1]) if len(fields) > 1 else 0
-            name = read_cstr(name_off) if 0 <= name_off < str_size else ""
+                sid = int(fields[0]) if len(fields) > 0 else 0
+                name_off = int(fields[1]) if len(fields) > 1 else 0
+                name = read_cstr(name_off) if 0 <= name_off < str_size else ""
 
-            if sid <= 0:
-                continue
-            if not name:
-                name = f"Sort {sid}"
+                if sid <= 0:
+                    continue
+                if not name:
+                    name = f"Sort {sid}"
 
-            out.append((sid, name))
+                out.append((sid, name))
 
         out.sort(key=lambda t: t[1].lower())
 
@@ -2082,7 +2010,7 @@ class QuestEditor(QtWidgets.QWidget):
 
 
     def _sync_loot_from_required_items(self) -> None:
-        if not hasattr(self, "quest_loot"):
+        if self.quest_loot is None:
             return
         if getattr(self, "current_id", None) is None:
             return
@@ -2244,16 +2172,49 @@ class QuestEditor(QtWidgets.QWidget):
             for c in list(getattr(self, "_name_labels", {}).keys()):
                 self._schedule_lookup(c)
 
+    def _ensure_quest_loot(self) -> QuestLootEditor:
+        """Swap the placeholder tab for the real loot editor (first use only)."""
+        if self.quest_loot is not None:
+            return self.quest_loot
+        self.quest_loot = QuestLootEditor(self.db, self.log, self)
+        idx = self.tabs.indexOf(self._loot_stub)
+        blocker = QtCore.QSignalBlocker(self.tabs)
+        self.tabs.removeTab(idx)
+        self.tabs.insertTab(idx, self.quest_loot, "Quest Loot Conditions")
+        self.tabs.setCurrentIndex(idx)
+        del blocker
+        self._loot_stub.deleteLater()
+        if self.current_id is not None:
+            self.quest_loot.load(int(self.current_id))
+            self.quest_loot.sync_from_required_items(self._get_required_item_ids())
+        return self.quest_loot
+
     def _on_tab_changed(self, idx: int) -> None:
+        if self.tabs.widget(idx) is self._loot_stub:
+            self._ensure_quest_loot()
+            return
         if self.current_id is None:
             return
-        if self.tabs.widget(idx) is self.quest_loot:
+        if self.quest_loot is not None and self.tabs.widget(idx) is self.quest_loot:
             # Ensure loot editor is pointed at the current quest
             if getattr(self.quest_loot, "quest_id", None) != int(self.current_id):
                 self.quest_loot.load(int(self.current_id))
    
     def load(self, quest_id: int) -> None:
-        row = self.db.fetch_one("SELECT * FROM quest_template WHERE entry = %s", (quest_id,))
+        # Fetch on a pool worker; apply on the GUI thread. A newer load() wins.
+        self._load_seq += 1
+        seq = self._load_seq
+        self.db.submit(
+            self.db.fetch_one,
+            "SELECT * FROM quest_template WHERE entry = %s",
+            (quest_id,),
+            on_done=lambda row: self._apply_loaded(seq, quest_id, row),
+            on_error=lambda e: self.log(f"ERROR loading quest {quest_id}: {e}"),
+        )
+
+    def _apply_loaded(self, seq: int, quest_id: int, row: Optional[Dict[str, Any]]) -> None:
+        if seq != self._load_seq:
+            return
         if not row:
             QtWidgets.QMessageBox.warning(self, "Not found", f"Quest {quest_id} not found.")
             return
@@ -2329,8 +2290,8 @@ class QuestEditor(QtWidgets.QWidget):
         if hasattr(self, "relations"):
             self.relations.load(quest_id)
 
-        # Auto-load + auto-sync quest loot conditions
-        if hasattr(self, "quest_loot"):
+        # Auto-load + auto-sync quest loot conditions (deferred until the tab is first opened)
+        if self.quest_loot is not None:
             self.quest_loot.load(quest_id)
             self.quest_loot.sync_from_required_items(self._get_required_item_ids())
 
@@ -2513,17 +2474,9 @@ class QuestEditor(QtWidgets.QWidget):
                     return
 
         try:
-            row = self.db.fetch_one(
-                """
-                SELECT COALESCE(MAX(entry), %s - 1) AS m
-                FROM quest_template
-                WHERE entry BETWEEN %s AND %s
-                """,
-                (QUEST_ID_MIN, QUEST_ID_MIN, QUEST_ID_MAX),
-            )
-
-            new_id = int(row["m"]) + 1
-            if new_id > QUEST_ID_MAX:
+            new_id = self.db.create_next_quest(QUEST_ID_MIN, QUEST_ID_MAX)
+            if new_id is None:
+                self.db.rollback()
                 QtWidgets.QMessageBox.critical(
                     self,
                     "Quest ID Range Exhausted",
@@ -2531,7 +2484,6 @@ class QuestEditor(QtWidgets.QWidget):
                 )
                 return
 
-            self.db.create_quest(new_id)
             self.db.commit()
         except Exception as e:
             self.db.rollback()
@@ -2584,7 +2536,11 @@ class QuestEditor(QtWidgets.QWidget):
             self.db.execute(sql, params)
             self.db.commit()
             self.log(f"Saved quest {self.current_id} ({len(cols)} fields).")
-            self.load(self.current_id)  # refresh orig snapshot
+            # What was just written is the new baseline; the async reload only
+            # re-syncs values the server normalises (NULL -> column default, etc.)
+            self._orig.update({c: data[c] for c in cols})
+            self._update_dirty_title()
+            self.load(self.current_id)
         except Exception as e:
             self.db.rollback()
             QtWidgets.QMessageBox.critical(self, "Save failed", str(e))
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from PyQt6 import QtWidgets, QtCore
 from PyQt6.QtCore import Qt
@@ -7,6 +7,45 @@ from PyQt6.QtCore import Qt
 from db import Database
 
 
+class QuestResultsModel(QtCore.QAbstractTableModel):
+    """Search results (already capped by the query's LIMIT)."""
+    HEADERS = ["entry", "Title", "MinLvl"]
+    KEYS = ("entry", "Title", "MinLevel")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+
+    def reset(self, rows: List[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return str(self._rows[index.row()].get(self.KEYS[index.column()], ""))
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def entry_at(self, row: int) -> Optional[int]:
+        if 0 <= row < len(self._rows):
+            try:
+                return int(self._rows[row].get("entry"))
+            except Exception:
+                return None
+        return None
+
+
 class QuestSearchPanel(QtWidgets.QWidget):
     quest_selected = QtCore.pyqtSignal(int)
 
@@ -24,8 +63,10 @@ class QuestSearchPanel(QtWidgets.QWidget):
         top.addWidget(self.edit, 1)
         top.addWidget(self.btn)
 
-        self.table = QtWidgets.QTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(["entry", "Title", "MinLvl"])
+        self.model = QuestResultsModel(self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
+        self.table.verticalHeader().setVisible(False)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -43,35 +84,37 @@ class QuestSearchPanel(QtWidgets.QWidget):
             return
 
         # Prefer exact ID if numeric, else title search.
-        rows = []
         try:
             qid = int(q)
-            rows = self.db.fetch_all(
+            rows = self.db.fetch_all_cached(
                 "SELECT entry, Title, MinLevel FROM quest_template WHERE entry = %s LIMIT 200",
                 (qid,),
             )
+            self.model.reset(rows)
+            self.log(f"Search '{q}' → {len(rows)} result(s)")
         except ValueError:
+            # Title matches come from the local lookup mirror once it is loaded;
+            # until then (or after a write/TTL) ask MySQL and rebuild it in the background.
             like = f"%{q}%"
-            rows = self.db.fetch_all(
-                "SELECT entry, Title, MinLevel FROM quest_template WHERE Title LIKE %s ORDER BY entry DESC LIMIT 200",
-                (like,),
-            )
-
-        self.table.setRowCount(0)
-        for r in rows:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(r.get("entry",""))))
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(str(r.get("Title",""))))
-            self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(str(r.get("MinLevel",""))))
-        self.log(f"Search '{q}' → {len(rows)} result(s)")
+            if self.db.mirror.ready("quest_template"):
+                rows = self.db.mirror.execute(
+                    "quest_template",
+                    "SELECT entry, Title, MinLevel FROM quest_template WHERE Title LIKE ? ORDER BY entry DESC LIMIT 200",
+                    (like,),
+                )
+            else:
+                rows = self.db.fetch_all(
+                    "SELECT entry, Title, MinLevel FROM quest_template WHERE Title LIKE %s ORDER BY entry DESC LIMIT 200",
+                    (like,),
+                )
+                self.db.refresh_mirror(
+                    "quest_template", on_error=lambda e: self.log(f"Search mirror refresh failed: {e}")
+                )
+            self.model.reset(rows)
+            self.log(f"Search '{q}' → {len(rows)} result(s)")
 
     def _open_selected(self) -> None:
-        row = self.table.currentRow()
-        if row < 0:
-            return
-        try:
-            qid = int(self.table.item(row, 0).text())
-        except Exception:
+        qid = self.model.entry_at(self.table.currentIndex().row())
+        if qid is None:
             return
         self.quest_selected.emit(qid)